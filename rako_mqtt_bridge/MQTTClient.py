@@ -31,7 +31,13 @@ class MQTTClient:
 
     def publish(self, topic, payload=None, qos=0, retain=False):
         (rc, message_id) = self.mqttc.publish(topic, payload, qos, retain)
-        _LOGGER.debug(f"published to {topic}: {payload}. response: {(rc, message_id)}")
+        _LOGGER.debug("published to %s: %s. response: %s", topic, payload, (rc, message_id))
 
     def connect(self):
         self.mqttc.connect(self.host, 1883, 60)
+        # Run paho's network I/O on its own thread so publish only enqueues
+        self.mqttc.loop_start()
+
+    def disconnect(self):
+        self.mqttc.loop_stop()
+        self.mqttc.disconnect()
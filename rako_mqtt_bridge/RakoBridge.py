@@ -1,15 +1,27 @@
+import asyncio
+import binascii
 import logging
+import aiohttp
+from collections import deque
 from enum import IntEnum, Enum, auto
-from typing import Optional, Tuple, Dict, Any, List, Union, Final
+from typing import Optional, Tuple, Dict, Any, List, Union, Final, Callable, Sequence, Deque, ClassVar
 from .telnet_interface import RakoTelnetInterface
 from dataclasses import dataclass
+import random
+import select
 import socket
+import sys
+import time
+from array import array
 from functools import lru_cache
 
-from rakomqtt.model import mqtt_payload_schema
+from rakomqtt.model import load_mqtt_payload
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT: Final[int] = 5
+# Total seconds post_command keeps retrying, and its first backoff delay
+COMMAND_RETRY_BUDGET: Final[float] = 3.0
+COMMAND_RETRY_INITIAL_DELAY: Final[float] = 0.05
 
 class RakoCommandType(Enum):
     """Rako bridge command types.
@@ -41,11 +53,14 @@ class RakoCommandType(Enum):
     @classmethod
     def from_byte(cls, byte_value: int) -> 'RakoCommandType':
         """Convert a byte value to RakoCommandType."""
-        try:
-            return cls(byte_value)
-        except ValueError:
-            _LOGGER.warning(f"Unknown command type: 0x{byte_value:02x}, treating as BUTTON_PRESS")
+        command = _CMD_BY_BYTE.get(byte_value)
+        if command is None:
+            _LOGGER.warning("Unknown command type: 0x%02x, treating as BUTTON_PRESS", byte_value)
             return cls.BUTTON_PRESS
+        return command
+
+# Plain dict lookup for the per-packet path; Enum.__call__ goes through the metaclass
+_CMD_BY_BYTE: Final[Dict[int, RakoCommandType]] = {c.value: c for c in RakoCommandType}
 
 HOLIDAY_MODE_FLAGS: Final[Dict[str, int]] = {
     'STOP_PLAYBACK': 0x00,
@@ -70,6 +85,22 @@ SCENE_COMMAND_TO_NUMBER: Final[Dict[RakoCommandType, int]] = {
     v: k for k, v in SCENE_NUMBER_TO_COMMAND.items()
 }
 
+# Bare payloads accepted on a channel's cover command topic
+COVER_COMMANDS: Final[Dict[str, RakoCommandType]] = {
+    'OPEN': RakoCommandType.FADE_UP,
+    'CLOSE': RakoCommandType.FADE_DOWN,
+    'STOP': RakoCommandType.STOP
+}
+
+# Brightness for each scene, indexed by scene number (0 is off)
+SCENE_BRIGHTNESS: Final[Tuple[int, ...]] = (
+    0,    # Off
+    255,  # Scene 1 (brightest)
+    192,  # Scene 2
+    128,  # Scene 3
+    64,   # Scene 4
+)
+
 class RakoFadeRate(IntEnum):
     """Rako fade rates in seconds."""
     INSTANT = 0    # No fade
@@ -82,16 +113,35 @@ class RakoFadeRate(IntEnum):
     @classmethod
     def from_string(cls, name: str) -> 'RakoFadeRate':
         """Convert string name to RakoFadeRate."""
-        try:
-            return cls[name.upper()]
-        except KeyError:
-            _LOGGER.warning(f"Invalid fade rate '{name}', using MEDIUM")
+        fade_rate = _FADE_BY_NAME.get(name.upper())
+        if fade_rate is None:
+            _LOGGER.warning("Invalid fade rate '%s', using MEDIUM", name)
             return cls.MEDIUM
+        return fade_rate
+
+_FADE_BY_NAME: Final[Dict[str, RakoFadeRate]] = dict(RakoFadeRate.__members__)
+
+# Scene for each brightness 0-255: 255 is scene 1, 192+ scene 2, 128+ scene 3,
+# 64+ scene 4 and anything dimmer is off
+_BRIGHTNESS_TO_SCENE: Final[bytes] = bytes(
+    1 if b >= 255 else 2 if b >= 192 else 3 if b >= 128 else 4 if b >= 64 else 0
+    for b in range(256)
+)
+
+# Fade rate for each whole-second transition; the last entry covers anything longer
+_TRANSITION_TO_FADE: Final[Tuple[RakoFadeRate, ...]] = (
+    (RakoFadeRate.INSTANT,)
+    + (RakoFadeRate.FAST,) * 2       # 1-2s
+    + (RakoFadeRate.MEDIUM,) * 2     # 3-4s
+    + (RakoFadeRate.SLOW,) * 4       # 5-8s
+    + (RakoFadeRate.VERY_SLOW,) * 8  # 9-16s
+    + (RakoFadeRate.EXTRA_SLOW,)     # 17s+
+)
 
 class RakoDeserialisationException(Exception):
     """Exception raised when deserializing Rako messages fails."""
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RakoStatusMessage:
     room_id: int          # Changed from 'room' to 'room_id'
     channel_id: int       # Changed from 'channel' to 'channel_id'
@@ -100,10 +150,10 @@ class RakoStatusMessage:
     brightness: Optional[int] = None
 
     @classmethod
-    def from_byte_list(cls, byte_list: List[int]) -> 'RakoStatusMessage':
-        if chr(byte_list[0]) != 'S':
+    def from_byte_list(cls, byte_list: Union[bytes, Sequence[int]]) -> 'RakoStatusMessage':
+        if byte_list[0] != 0x53:  # 'S' for status
             raise RakoDeserialisationException(
-                f'Unsupported UDP message type: {chr(byte_list[0])}'
+                f'Unsupported UDP message type: 0x{byte_list[0]:02x}'
             )
 
         data_length = byte_list[1] - 5
@@ -112,12 +162,12 @@ class RakoStatusMessage:
         command_byte = byte_list[5]
         data = byte_list[6:6 + data_length] if data_length > 0 else []
 
-        _LOGGER.debug(f"Command byte: 0x{command_byte:02x}")
+        _LOGGER.debug("Command byte: 0x%02x", command_byte)
 
         # Handle button press command (0x33)
         if command_byte == 0x33:
             scene = data[-1] if data else 0
-            _LOGGER.debug(f"Button press detected - Scene: {scene}")
+            _LOGGER.debug("Button press detected - Scene: %s", scene)
             return cls(
                 room_id=room_id,
                 channel_id=channel_id,
@@ -126,70 +176,107 @@ class RakoStatusMessage:
                 brightness=cls._scene_brightness(scene)
             )
 
-        try:
-            command = RakoCommandType(command_byte)
-        except ValueError as e:
-            _LOGGER.error(f"Failed to create RakoCommandType from value 0x{command_byte:02x}")
-            raise RakoDeserialisationException(str(e))
+        command = _CMD_BY_BYTE.get(command_byte)
+        if command is None:
+            _LOGGER.error("Failed to create RakoCommandType from value 0x%02x", command_byte)
+            raise RakoDeserialisationException(f"{command_byte} is not a valid RakoCommandType")
 
-        _LOGGER.debug(f"Processing status message - Room: {room_id}, Channel: {channel_id}, Command: {command}, Data: {data}")
+        _LOGGER.debug("Processing status message - Room: %s, Channel: %s, Command: %s, Data: %s",
+                      room_id, channel_id, command, data)
 
-        match command:
-            case RakoCommandType.LEVEL_SET_LEGACY | RakoCommandType.SET_LEVEL:
-                if len(data) >= 2:
-                    brightness = data[1]
-                    return cls(
-                        room_id=room_id,
-                        channel_id=channel_id,
-                        command=command,
-                        brightness=brightness,
-                    )
-            case RakoCommandType.SET_SCENE:
-                scene = data[1]
-                return cls(
-                    room_id=room_id,
-                    channel_id=channel_id,
-                    command=command,
-                    scene=scene,
-                    brightness=cls._scene_brightness(scene),
-                )
-            case RakoCommandType.FADE_UP:
-                return cls(
-                    room_id=room_id,
-                    channel_id=channel_id,
-                    command=command,
-                    brightness=255
-                )
-            case RakoCommandType.FADE_DOWN:
-                return cls(
-                    room_id=room_id,
-                    channel_id=channel_id,
-                    command=command,
-                    brightness=0
-                )
-            case RakoCommandType.STOP:
-                return cls(
-                    room_id=room_id,
-                    channel_id=channel_id,
-                    command=command,
-                )
+        parser = _STATUS_PARSERS.get(command)
+        if parser is not None:
+            status = parser(room_id, channel_id, command, data)
+            if status is not None:
+                return status
 
         raise RakoDeserialisationException(f"Unhandled command type: {command}")
 
     @staticmethod
-    @lru_cache(maxsize=None)
     def _scene_brightness(rako_scene_number: int) -> int:
-        scene_brightness: Final[Dict[int, int]] = {
-            1: 255,  # Scene 1 (brightest)
-            2: 192,  # Scene 2
-            3: 128,  # Scene 3
-            4: 64,   # Scene 4
-            0: 0,    # Off
-        }
-        return scene_brightness[rako_scene_number]
+        return SCENE_BRIGHTNESS[rako_scene_number]
+
+
+def _status_level(room_id: int, channel_id: int, command: RakoCommandType,
+                  data: Sequence[int]) -> Optional[RakoStatusMessage]:
+    if len(data) >= 2:
+        return RakoStatusMessage(
+            room_id=room_id,
+            channel_id=channel_id,
+            command=command,
+            brightness=data[1],
+        )
+    return None
+
+def _status_scene(room_id: int, channel_id: int, command: RakoCommandType,
+                  data: Sequence[int]) -> RakoStatusMessage:
+    scene = data[1]
+    return RakoStatusMessage(
+        room_id=room_id,
+        channel_id=channel_id,
+        command=command,
+        scene=scene,
+        brightness=RakoStatusMessage._scene_brightness(scene),
+    )
+
+def _status_fade_up(room_id: int, channel_id: int, command: RakoCommandType,
+                    data: Sequence[int]) -> RakoStatusMessage:
+    return RakoStatusMessage(
+        room_id=room_id,
+        channel_id=channel_id,
+        command=command,
+        brightness=255
+    )
+
+def _status_fade_down(room_id: int, channel_id: int, command: RakoCommandType,
+                      data: Sequence[int]) -> RakoStatusMessage:
+    return RakoStatusMessage(
+        room_id=room_id,
+        channel_id=channel_id,
+        command=command,
+        brightness=0
+    )
+
+def _status_stop(room_id: int, channel_id: int, command: RakoCommandType,
+                 data: Sequence[int]) -> RakoStatusMessage:
+    return RakoStatusMessage(
+        room_id=room_id,
+        channel_id=channel_id,
+        command=command,
+    )
+
+# Status message parser for each command type, looked up per UDP packet.
+# A parser may return None when the data doesn't fit the command.
+_STATUS_PARSERS: Final[Dict[RakoCommandType, Callable[
+    [int, int, RakoCommandType, Sequence[int]], Optional[RakoStatusMessage]
+]]] = {
+    RakoCommandType.LEVEL_SET_LEGACY: _status_level,
+    RakoCommandType.SET_LEVEL: _status_level,
+    RakoCommandType.SET_SCENE: _status_scene,
+    RakoCommandType.FADE_UP: _status_fade_up,
+    RakoCommandType.FADE_DOWN: _status_fade_down,
+    RakoCommandType.STOP: _status_stop,
+}
+
+
+@lru_cache(maxsize=512)
+def _route_topic(topic: str) -> Optional[Tuple[str, int, int]]:
+    """Match an inbound topic by its segments.
+
+    rako/room/<room>/channel/<channel>/(set|command) yields
+    (action, room_id, channel_id); any other topic yields None.
+    Memoized, as an install only has a bounded set of channel topics.
+    """
+    parts = topic.split('/')
+    if (len(parts) == 6 and parts[0] == 'rako' and parts[1] == 'room'
+            and parts[3] == 'channel' and parts[5] in ('set', 'command')):
+        room, channel = parts[2], parts[4]
+        if room.isascii() and room.isdigit() and channel.isascii() and channel.isdigit():
+            return parts[5], int(room), int(channel)
+    return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RakoCommand:
     room_id: int  # Changed from 'room' to 'room_id' to match constructor
     channel_id: int  # Changed from 'channel' to 'channel_id'
@@ -201,83 +288,62 @@ class RakoCommand:
     @staticmethod
     def _rako_command(brightness: int) -> int:
         """Convert brightness to Rako scene number"""
-        if brightness == 0:
-            return 0  # OFF
-        elif brightness >= 255:
-            return 1  # Scene 1 (100%)
-        elif brightness >= 192:
-            return 2  # Scene 2 (75%)
-        elif brightness >= 128:
-            return 3  # Scene 3 (50%)
-        elif brightness >= 64:
-            return 4  # Scene 4 (25%)
-        return 0  # Default to OFF
+        return _BRIGHTNESS_TO_SCENE[min(max(brightness, 0), 255)]
 
     @classmethod
-    def from_mqtt(cls, topic: str, payload_str: str) -> Optional['RakoCommand']:
-        """Create RakoCommand from MQTT message"""
-        import re
-        topic_patterns = {
-            'channel': r'^rako/room/([0-9]+)/channel/([0-9]+)/set$',
-            'command': r'^rako/room/([0-9]+)/channel/([0-9]+)/command$'
-        }
+    def from_mqtt(cls, topic: str, raw_payload: Union[str, bytes]) -> Optional['RakoCommand']:
+        """Create RakoCommand from MQTT message
 
-        matches = {
-            name: re.match(pattern, topic)
-            for name, pattern in topic_patterns.items()
-        }
-
-        try:
-            # If payload is a raw command string, wrap it in a dict
-            if payload_str.strip('"\'').upper() in ['OPEN', 'CLOSE', 'STOP']:
-                payload = {'command': payload_str.strip('"\'').upper()}
-            else:
-                payload = mqtt_payload_schema.loads(payload_str)
-
-            # Extract transition time if provided (in seconds)
-            transition = payload.get('transition')
-            fade_rate = None
-            if transition is not None:
-                # Map transition time to closest Rako fade rate
-                if transition == 0:
-                    fade_rate = RakoFadeRate.INSTANT
-                elif transition <= 2:
-                    fade_rate = RakoFadeRate.FAST
-                elif transition <= 4:
-                    fade_rate = RakoFadeRate.MEDIUM
-                elif transition <= 8:
-                    fade_rate = RakoFadeRate.SLOW
-                elif transition <= 16:
-                    fade_rate = RakoFadeRate.VERY_SLOW
-                else:
-                    fade_rate = RakoFadeRate.EXTRA_SLOW
-
-            if matches['command']:  # Move command matching to first position
-                room_id = int(matches['command'].group(1))
-                channel_id = int(matches['command'].group(2))
-                command_str = payload_str.strip().strip('"\'').upper()
+        The payload may be the raw bytes paho delivers; JSON bodies are
+        parsed from bytes directly and only bare strings are decoded.
+        """
+        route = _route_topic(topic)
+        if route is None:
+            _LOGGER.warning("No matching topic pattern for: %s", topic)
+            return None
+        if not raw_payload:
+            _LOGGER.warning("Empty payload for: %s", topic)
+            return None
 
-                command_map = {
-                    'OPEN': RakoCommandType.FADE_UP,
-                    'CLOSE': RakoCommandType.FADE_DOWN,
-                    'STOP': RakoCommandType.STOP
-                }
+        action, room_id, channel_id = route
 
-                if command_str in command_map:
+        try:
+            if action == 'command':
+                # Cover commands are bare strings, so skip the JSON schema entirely
+                if isinstance(raw_payload, bytes):
+                    raw_payload = raw_payload.decode('ascii', 'replace')
+                # Only the bare or quoted command matches; padded payloads are rejected
+                command_str = raw_payload.strip('"\'').upper()
+                command = COVER_COMMANDS.get(command_str)
+
+                if command is not None:
                     return cls(
                         room_id=room_id,
                         channel_id=channel_id,
-                        command=command_map[command_str],
-                        fade_rate=fade_rate
+                        command=command
                     )
                 else:
-                    _LOGGER.warning(f"Unsupported cover command: {command_str}")
+                    _LOGGER.warning("Unsupported cover command: %s", command_str)
                     return None
 
-            elif matches['channel']:
-                room_id = int(matches['channel'].group(1))
-                channel_id = int(matches['channel'].group(2))
-                _LOGGER.debug(f"Processing channel command for room {room_id} channel {channel_id}")
+            else:
+                if isinstance(raw_payload, bytes) and not raw_payload.lstrip().startswith(b'{'):
+                    raw_payload = raw_payload.decode('ascii', 'replace')
+
+                # A bare cover command carries no state or brightness
+                if isinstance(raw_payload, str) and raw_payload.strip('"\'').upper() in COVER_COMMANDS:
+                    return None
+
+                payload = load_mqtt_payload(raw_payload)
+
+                # Extract transition time if provided (in seconds)
+                transition = payload.get('transition')
+                fade_rate = None
+                if transition is not None:
+                    # Map transition time to closest Rako fade rate
+                    fade_rate = _TRANSITION_TO_FADE[min(transition, len(_TRANSITION_TO_FADE) - 1)]
+
+                _LOGGER.debug("Processing channel command for room %s channel %s", room_id, channel_id)
 
                 if 'state' in payload:
                     if payload['state'] == 'ON':
@@ -296,74 +362,132 @@ class RakoCommand:
                     fade_rate=fade_rate
                 )
 
-            else:
-                _LOGGER.warning(f"No matching topic pattern for: {topic}")
-                return None
-
         except Exception as e:
-            _LOGGER.error(f"Error processing MQTT message: {e}")
+            _LOGGER.error("Error processing MQTT message: %s", e)
             return None
 
-    def to_udp_command(self) -> List[int]:
+    def to_udp_command(self) -> bytes:
         """Convert RakoCommand to UDP command bytes"""
-        if self.command:
-            command_type = self.command
-            data = [0x00]  # Add a data byte with value 0
-        elif self.scene is not None:
-            command_type = RakoCommandType.SET_SCENE
-            # Set fade rate flags in first data byte
-            flags = self.fade_rate.value if self.fade_rate else RakoFadeRate.MEDIUM.value
-            data = [flags, self.scene]
-        else:
-            command_type = RakoCommandType.SET_LEVEL
-            # Set fade rate flags in first data byte
-            flags = self.fade_rate.value if self.fade_rate else RakoFadeRate.MEDIUM.value
-            data = [flags, self.brightness]
-
-        room_high = (self.room_id >> 8) & 0xFF
-        room_low = self.room_id & 0xFF
-
-        command = [
-            0x52,  # 'R' for request
-            5 + len(data),  # Number of bytes to follow
-            room_high,
-            room_low,
+        fade_rate = self.fade_rate.value if self.fade_rate else RakoFadeRate.MEDIUM.value
+        return _encode_udp_command(
+            self.room_id,
             self.channel_id,
-            command_type.value,
-            *data
-        ]
+            self.scene,
+            self.brightness,
+            self.command.value if self.command else None,
+            fade_rate
+        )
 
-        # Calculate checksum
-        checksum = (256 - sum(command[1:]) % 256) % 256
-        command.append(checksum)
 
-        return command
+_SET_SCENE_VALUE: Final[int] = RakoCommandType.SET_SCENE.value
+_SET_LEVEL_VALUE: Final[int] = RakoCommandType.SET_LEVEL.value
+
+@lru_cache(maxsize=2048)
+def _encode_udp_command(room_id: int, channel_id: int, scene: Optional[int],
+                        brightness: Optional[int], command_value: Optional[int],
+                        fade_rate: int) -> bytes:
+    """Build the UDP datagram for a command.
+
+    Memoized on the scalar command fields: dimmers tend to send the same
+    handful of commands over and over, and retries resend the same one.
+    """
+    room_high = (room_id >> 8) & 0xFF
+    room_low = room_id & 0xFF
+
+    # Everything after the 'R': byte count, address, command and data bytes
+    if command_value is not None:
+        body = (6, room_high, room_low, channel_id, command_value, 0x00)
+    elif scene is not None:
+        # Fade rate flags go in the first data byte
+        body = (7, room_high, room_low, channel_id, _SET_SCENE_VALUE, fade_rate, scene)
+    else:
+        body = (7, room_high, room_low, channel_id, _SET_LEVEL_VALUE, fade_rate, brightness)
+
+    # Checksum covers everything after the 'R'
+    return bytes((0x52, *body, RakoBridge.calculate_checksum(body)))
+
+# Separators stripped from the level cache hex dump before decoding
+HEX_WHITESPACE: Final[bytes] = b' \t\r\n'
 
-@dataclass
+# 'X' data record marker followed by the level cache record type
+LEVEL_CACHE_RECORD_HEADER: Final[bytes] = b'\x58\x04'
+
+@dataclass(slots=True)
 class SceneCacheEntry:
     """Represents a single scene cache entry."""
     room_id: int
     scene_id: int
 
-@dataclass
+@dataclass(slots=True)
 class LevelCacheEntry:
     """Represents a single level cache entry."""
     room_id: int
     channel_id: int
-    levels: List[int]  # List of 16 level values
+    levels: bytes  # 16 level values, one byte each
     active: bool
     deleted: bool
 
+class RakoCommandProtocol(asyncio.DatagramProtocol):
+    """Datagram endpoint used to send commands to the bridge.
+
+    The bridge answers each command with a bare acknowledgement that
+    doesn't identify the command, so responses are matched to sends in
+    FIFO order.
+    """
+
+    def __init__(self) -> None:
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self._sendto: Optional[Callable[[bytes], None]] = None
+        self._pending: Deque[asyncio.Future] = deque()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+        self._sendto = transport.sendto
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        future = self._next_pending()
+        if future is not None:
+            future.set_result(data)
+        else:
+            _LOGGER.debug("Unsolicited UDP response: %s", data)
+
+    def error_received(self, exc: Exception) -> None:
+        future = self._next_pending()
+        if future is not None:
+            future.set_exception(exc)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        while (future := self._next_pending()) is not None:
+            future.set_exception(exc or ConnectionError("UDP endpoint closed"))
+        self.transport = None
+
+    def _next_pending(self) -> Optional[asyncio.Future]:
+        # Skip futures whose sender already gave up waiting
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                return future
+        return None
+
+    def send(self, data: bytes) -> asyncio.Future:
+        """Send a datagram and return a future for the bridge's response."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(future)
+        self._sendto(data)
+        return future
+
+
 class RakoBridge:
     port: Final[int] = 9761
+    _discovered_host: ClassVar[Optional[str]] = None
 
     def __init__(self, host: Optional[str] = None, default_fade_rate: str = "medium"):
         self.host = host if host else self.find_bridge()
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self._socket.settimeout(DEFAULT_TIMEOUT)
+        self._command_protocol: Optional[RakoCommandProtocol] = None
+        self._http: Optional[aiohttp.ClientSession] = None
         self._telnet: Optional[RakoTelnetInterface] = None
         self._use_telnet = False
-        self._command_retries = 3
+        self._command_retry_budget = COMMAND_RETRY_BUDGET
         self.default_fade_rate = RakoFadeRate.from_string(default_fade_rate)
 
     def create_command(self, room_id: int, channel_id: int,
@@ -388,22 +512,23 @@ class RakoBridge:
             try:
                 await self._telnet.connect()
             except Exception as e:
-                _LOGGER.error(f"Failed to initialize telnet interface: {e}")
+                _LOGGER.error("Failed to initialize telnet interface: %s", e)
                 self._telnet = None
 
     async def get_level_cache(self) -> List[LevelCacheEntry]:
         """Get current level cache from bridge."""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"http://{self.host}/levels.htm"
-                async with session.get(url) as response:
-                    content = await response.text()
-                    return self._parse_level_cache(content)
+            session = await self._http_session()
+            url = f"http://{self.host}/levels.htm"
+            async with session.get(url) as response:
+                # Keep the body as bytes; it's hex text, so there's nothing to decode
+                content = await response.read()
+                return self._parse_level_cache(content)
         except Exception as e:
-            _LOGGER.error(f"Failed to get level cache: {e}")
+            _LOGGER.error("Failed to get level cache: %s", e)
             return []
 
-    def _parse_level_cache(self, cache_content: str) -> List[LevelCacheEntry]:
+    def _parse_level_cache(self, cache_content: Union[bytes, str]) -> List[LevelCacheEntry]:
         """Parse level cache response.
 
         Format per documentation:
@@ -416,19 +541,15 @@ class RakoBridge:
         """
         entries = []
         try:
-            # Remove any whitespace and process in chunks
-            data = bytes.fromhex(cache_content.replace(' ', ''))
-
-            pos = 0
-            while pos < len(data):
-                if data[pos] != 0x58:  # 'X'
-                    pos += 1
-                    continue
-
-                if data[pos + 1] != 0x04:  # Level cache record type
-                    pos += 1
-                    continue
-
+            # Strip whitespace in one C-level pass and decode the hex in another
+            if isinstance(cache_content, str):
+                cache_content = cache_content.encode('ascii')
+            data = binascii.a2b_hex(cache_content.translate(None, HEX_WHITESPACE))
+
+            # Let bytes.find scan for the next 'X' + level cache record type
+            # header in C rather than stepping through the buffer in Python
+            pos = data.find(LEVEL_CACHE_RECORD_HEADER)
+            while pos != -1:
                 flags = data[pos + 2]
                 active = bool(flags & 0x80)
                 deleted = bool(flags & 0x40)
@@ -437,7 +558,7 @@ class RakoBridge:
                 channel_id = data[pos + 4]
 
                 # Get 16 level values
-                levels = list(data[pos + 5:pos + 21])
+                levels = bytes(data[pos + 5:pos + 21])
 
                 entries.append(LevelCacheEntry(
                     room_id=room_id,
@@ -447,10 +568,10 @@ class RakoBridge:
                     deleted=deleted
                 ))
 
-                pos += 21  # Move to next record
+                pos = data.find(LEVEL_CACHE_RECORD_HEADER, pos + 21)  # Move to next record
 
         except Exception as e:
-            _LOGGER.error(f"Error parsing level cache: {e}")
+            _LOGGER.error("Error parsing level cache: %s", e)
 
         return entries
 
@@ -462,20 +583,37 @@ class RakoBridge:
         - Room 6 Scene 4
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"http://{self.host}/scenes.htm"
-                async with session.get(url) as response:
-                    content = await response.text()
-                    return self._parse_scene_cache(content)
+            session = await self._http_session()
+            url = f"http://{self.host}/scenes.htm"
+            async with session.get(url) as response:
+                content = await response.text()
+                return self._parse_scene_cache(content)
         except Exception as e:
-            _LOGGER.error(f"Failed to get scene cache: {e}")
+            _LOGGER.error("Failed to get scene cache: %s", e)
             return []
 
     def _parse_scene_cache(self, cache_content: str) -> List[SceneCacheEntry]:
         """Parse scene cache hex string into entries."""
-        entries = []
         # Remove 0x prefix if present and process in 4-character chunks
         cache_content = cache_content.replace('0x', '')
+
+        # Fast path: decode all complete chunks in one go as big-endian
+        # 16-bit words when they are nothing but hex digits
+        whole = cache_content[:len(cache_content) - len(cache_content) % 4]
+        try:
+            data = bytes.fromhex(whole)
+        except ValueError:
+            data = None
+        if data is not None and len(data) * 2 == len(whole):  # fromhex skips whitespace
+            values = array('H', data)
+            if sys.byteorder == 'little':
+                values.byteswap()
+            return [
+                SceneCacheEntry(room_id=value & 0x3FF, scene_id=(value >> 12) & 0x0F)
+                for value in values
+            ]
+
+        entries = []
         for i in range(0, len(cache_content), 4):
             chunk = cache_content[i:i+4]
             if len(chunk) == 4:
@@ -485,20 +623,26 @@ class RakoBridge:
                     room_id = value & 0x3FF         # Last 10 bits
                     entries.append(SceneCacheEntry(room_id=room_id, scene_id=scene_id))
                 except ValueError:
-                    _LOGGER.warning(f"Invalid scene cache entry: {chunk}")
+                    _LOGGER.warning("Invalid scene cache entry: %s", chunk)
                     continue
         return entries
 
     @classmethod
     def find_bridge(cls) -> Optional[str]:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        sock.settimeout(DEFAULT_TIMEOUT)
+        # Bridges constructed later in the same process reuse the first lookup
+        if cls._discovered_host is not None:
+            return cls._discovered_host
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.setblocking(False)
+
+            resp = cls.poll_for_bridge_response(sock)
 
-        resp = cls.poll_for_bridge_response(sock)
         if resp:
             _, (host, _) = resp
-            _LOGGER.debug(f'Found Rako bridge at {host}')
+            _LOGGER.debug('Found Rako bridge at %s', host)
+            cls._discovered_host = host
             return host
         else:
             _LOGGER.error('Cannot find a Rako bridge after 3 attempts')
@@ -507,56 +651,99 @@ class RakoBridge:
     @classmethod
     def poll_for_bridge_response(cls, sock: socket.socket) -> Optional[Tuple[bytes, Any]]:
         sock.bind(('', 0))
+        # Send every broadcast up front and wait once for the first reply,
+        # rather than waiting out a full timeout after each attempt
         for i in range(1, 4):
-            _LOGGER.debug(f"Broadcasting attempt #{i} to find Rako bridge...")
+            _LOGGER.debug("Broadcasting attempt #%s to find Rako bridge...", i)
             sock.sendto(b'D', ('255.255.255.255', cls.port))
+
+        deadline = time.monotonic() + DEFAULT_TIMEOUT
+        while (remaining := deadline - time.monotonic()) > 0:
+            ready, _, _ = select.select([sock], [], [], remaining)
+            if not ready:
+                break
             try:
                 resp = sock.recvfrom(256)
-                _LOGGER.debug(f"Received response: {resp}")
-                return resp
-            except socket.timeout:
-                _LOGGER.debug(f"No Rako bridge found on try #{i}")
+            except BlockingIOError:
+                continue
+            _LOGGER.debug("Received response: %s", resp)
+            return resp
+
+        _LOGGER.debug("No Rako bridge responded")
         return None
 
     @staticmethod
-    def calculate_checksum(data: List[int]) -> int:
+    def calculate_checksum(data: Union[bytes, bytearray, memoryview, Sequence[int]]) -> int:
         """Calculate checksum for UDP command"""
-        total = sum(data) % 256
-        return (256 - total) % 256
+        # Two's complement of the byte sum, i.e. (256 - sum % 256) % 256
+        return -sum(data) & 0xFF
+
+    async def _get_command_protocol(self) -> RakoCommandProtocol:
+        """Return the UDP command endpoint, creating it on first use."""
+        if self._command_protocol is None or self._command_protocol.transport is None:
+            loop = asyncio.get_running_loop()
+            _, self._command_protocol = await loop.create_datagram_endpoint(
+                RakoCommandProtocol,
+                remote_addr=(self.host, self.port)
+            )
+        return self._command_protocol
+
+    async def _http_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session for cache polling, creating it on first use."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+            )
+        return self._http
 
-    def send_udp_command(self, command_bytes: List[int]) -> None:
-        """Send UDP command to Rako bridge"""
+    async def close(self) -> None:
+        """Close the UDP command endpoint and the HTTP session."""
+        if self._command_protocol is not None and self._command_protocol.transport is not None:
+            self._command_protocol.transport.close()
+        self._command_protocol = None
+
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
+    async def send_udp_command(self, command_bytes: Union[bytes, List[int]]) -> None:
+        """Send UDP command to Rako bridge and wait for its acknowledgement"""
         try:
-            # Convert list of ints to bytes
-            data = bytes(command_bytes)
+            # to_udp_command already returns bytes; only convert int lists
+            data = command_bytes if isinstance(command_bytes, bytes) else bytes(command_bytes)
             
-            _LOGGER.debug(f"Sending raw bytes: {' '.join(f'0x{b:02x}' for b in data)}")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Sending raw bytes: %s", data.hex(' '))
             
-            self._socket.sendto(data, (self.host, self.port))
-            response = self._socket.recv(256)
+            protocol = await self._get_command_protocol()
+            response = await asyncio.wait_for(protocol.send(data), timeout=DEFAULT_TIMEOUT)
             
             if response == b'AOK\r\n':
                 _LOGGER.debug("Command acknowledged")
             else:
-                _LOGGER.warning(f"Unexpected response: {response}")
+                _LOGGER.warning("Unexpected response: %s", response)
                 # Log the command that caused the error
-                _LOGGER.warning(f"Command that caused error: {' '.join(f'0x{b:02x}' for b in command_bytes)}")
+                _LOGGER.warning("Command that caused error: %s", data.hex(' '))
         except Exception as e:
-            _LOGGER.error(f"Failed to send UDP command: {e}")
+            _LOGGER.error("Failed to send UDP command: %s", e)
 
     async def post_command(self, rako_command: RakoCommand) -> None:
         """Send command to Rako bridge using UDP with telnet fallback."""
-        for attempt in range(self._command_retries):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._command_retry_budget
+        delay = COMMAND_RETRY_INITIAL_DELAY
+        attempt = 0
+        while True:
+            attempt += 1
             try:
                 if not self._use_telnet:
                     # Try UDP first
                     command_bytes = rako_command.to_udp_command()
-                    _LOGGER.debug(f"Sending UDP command: {[hex(b) for b in command_bytes]}")
-                    self.send_udp_command(command_bytes)
+                    await self.send_udp_command(command_bytes)
                     return
                     
             except Exception as e:
-                _LOGGER.warning(f"UDP command failed (attempt {attempt + 1}): {e}")
+                _LOGGER.warning("UDP command failed (attempt %s): %s", attempt, e)
                 self._use_telnet = True
 
             if self._use_telnet:
@@ -581,13 +768,20 @@ class RakoBridge:
                         return
                         
                 except Exception as e:
-                    _LOGGER.error(f"Telnet command failed: {e}")
+                    _LOGGER.error("Telnet command failed: %s", e)
+                    if self._telnet:
+                        # Stops its writer task as well as closing the socket
+                        await self._telnet.disconnect()
                     self._telnet = None
                     self._use_telnet = False
                     
-            # Add delay between retries
-            if attempt < self._command_retries - 1:
-                await asyncio.sleep(1)
+            # Back off with jitter between retries, within the overall budget;
+            # the telnet fallback already runs straight after a UDP failure
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay + random.uniform(0, delay), remaining))
+            delay *= 2
                 
         raise Exception("Failed to send command via both UDP and telnet")
 
@@ -609,7 +803,7 @@ class RakoBridge:
                     # Process status message
                     self._process_status_message(status)
             except Exception as e:
-                _LOGGER.error(f"Error processing telnet response: {e}")
+                _LOGGER.error("Error processing telnet response: %s", e)
 
     def _parse_telnet_response(self, response: bytes) -> Optional[RakoStatusMessage]:
         """Parse telnet response into status message."""
@@ -618,7 +812,7 @@ class RakoBridge:
             # Convert telnet format to RakoStatusMessage
             pass
         except Exception as e:
-            _LOGGER.error(f"Error parsing telnet response: {e}")
+            _LOGGER.error("Error parsing telnet response: %s", e)
             return None
 
     @property
@@ -626,14 +820,14 @@ class RakoBridge:
         return bool(self.host)
 
     @classmethod
-    def process_udp_bytes(cls, byte_list: List[int]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    def process_udp_bytes(cls, byte_list: Union[bytes, Sequence[int]]) -> Optional[Tuple[str, Dict[str, Any]]]:
         """Process incoming UDP status messages"""
-        _LOGGER.debug(f'received byte_list: {byte_list}')
+        _LOGGER.debug('received byte_list: %s', byte_list)
 
         try:
             rako_status_message = RakoStatusMessage.from_byte_list(byte_list)
         except (RakoDeserialisationException, ValueError, IndexError) as ex:
-            _LOGGER.debug(f'unhandled bytestring: {ex}')
+            _LOGGER.debug('unhandled bytestring: %s', ex)
             return None
 
         topic = cls.create_topic(rako_status_message)
@@ -645,61 +839,85 @@ class RakoBridge:
     def create_topic(rako_status_message: RakoStatusMessage) -> str:
         """Create MQTT topic from status message."""
         # Always use channel format for status updates
-        return f"rako/room/{rako_status_message.room_id}/channel/{rako_status_message.channel_id}/state"
+        return _status_topic(rako_status_message.room_id, rako_status_message.channel_id)
 
     @staticmethod
     def create_payload(rako_status_message: RakoStatusMessage) -> Dict[str, Any]:
         """Create MQTT payload from status message"""
-        match rako_status_message.command:
-            case RakoCommandType.SET_LEVEL | RakoCommandType.LEVEL_SET_LEGACY:
-                return {
-                    "state": 'ON' if rako_status_message.brightness else 'OFF',
-                    "brightness": rako_status_message.brightness
-                }
-            case RakoCommandType.SET_SCENE:
-                state = 'ON' if rako_status_message.scene > 0 else 'OFF'
-                brightness = 255 if rako_status_message.scene > 0 else 0
-                return {
-                    "state": state,
-                    "brightness": brightness
-                }
-            case RakoCommandType.BUTTON_PRESS:  # Add this case
-                return {
-                    "state": 'ON' if rako_status_message.scene > 0 else 'OFF',
-                    "brightness": rako_status_message.brightness or 0,
-                    "scene": rako_status_message.scene,
-                    "event": "button_press",
-                    "event_type": "scene",
-                    "event_data": {
-                        "scene": rako_status_message.scene
-                    }
-                }
-            case RakoCommandType.FADE_UP:
-                return {
-                    "state": "ON",
-                    "brightness": 255,
-                    "action": "opening"
-                }
-            case RakoCommandType.FADE_DOWN:
-                return {
-                    "state": "ON",
-                    "brightness": 0,
-                    "action": "closing"
-                }
-            case RakoCommandType.STOP:
-                return {
-                    "action": "stopped"
-                }
-            case _:
-                _LOGGER.warning(f"Unsupported command type for payload: {rako_status_message.command}")
-                return {
-                    "state": "OFF",
-                    "brightness": 0
-                }
-
+        payload_builder = _PAYLOAD_BUILDERS.get(rako_status_message.command, _payload_unsupported)
+        return payload_builder(rako_status_message)
+
+
+@lru_cache(maxsize=512)
+def _status_topic(room_id: int, channel_id: int) -> str:
+    """Return the shared state topic string for a room channel."""
+    return f"rako/room/{room_id}/channel/{channel_id}/state"
+
+
+def _payload_level(rako_status_message: RakoStatusMessage) -> Dict[str, Any]:
+    return {
+        "state": 'ON' if rako_status_message.brightness else 'OFF',
+        "brightness": rako_status_message.brightness
+    }
+
+def _payload_scene(rako_status_message: RakoStatusMessage) -> Dict[str, Any]:
+    state = 'ON' if rako_status_message.scene > 0 else 'OFF'
+    brightness = 255 if rako_status_message.scene > 0 else 0
+    return {
+        "state": state,
+        "brightness": brightness
+    }
+
+def _payload_button_press(rako_status_message: RakoStatusMessage) -> Dict[str, Any]:
+    return {
+        "state": 'ON' if rako_status_message.scene > 0 else 'OFF',
+        "brightness": rako_status_message.brightness or 0,
+        "scene": rako_status_message.scene,
+        "event": "button_press",
+        "event_type": "scene",
+        "event_data": {
+            "scene": rako_status_message.scene
+        }
+    }
+
+def _payload_fade_up(rako_status_message: RakoStatusMessage) -> Dict[str, Any]:
+    return {
+        "state": "ON",
+        "brightness": 255,
+        "action": "opening"
+    }
+
+def _payload_fade_down(rako_status_message: RakoStatusMessage) -> Dict[str, Any]:
+    return {
+        "state": "ON",
+        "brightness": 0,
+        "action": "closing"
+    }
+
+def _payload_stop(rako_status_message: RakoStatusMessage) -> Dict[str, Any]:
+    return {
+        "action": "stopped"
+    }
+
+def _payload_unsupported(rako_status_message: RakoStatusMessage) -> Dict[str, Any]:
+    _LOGGER.warning("Unsupported command type for payload: %s", rako_status_message.command)
+    return {
+        "state": "OFF",
+        "brightness": 0
+    }
+
+# MQTT payload builder for each status command type
+_PAYLOAD_BUILDERS: Final[Dict[RakoCommandType, Callable[[RakoStatusMessage], Dict[str, Any]]]] = {
+    RakoCommandType.SET_LEVEL: _payload_level,
+    RakoCommandType.LEVEL_SET_LEGACY: _payload_level,
+    RakoCommandType.SET_SCENE: _payload_scene,
+    RakoCommandType.BUTTON_PRESS: _payload_button_press,
+    RakoCommandType.FADE_UP: _payload_fade_up,
+    RakoCommandType.FADE_DOWN: _payload_fade_down,
+    RakoCommandType.STOP: _payload_stop,
+}
 
 if __name__ == '__main__':
-    import sys
     bridge = RakoBridge()
     print(bridge.host)
     sys.exit(0 if bridge.host else 1)
@@ -1,20 +1,29 @@
 #!/usr/bin/env python3
 import argparse
+import json
 import logging
 import sys
-import os
 import asyncio
 from typing import NoReturn, Optional
 import signal
 from dataclasses import dataclass
 from contextlib import suppress
+from pathlib import Path
+
+try:
+    # uvloop is an optional, faster drop-in event loop (not on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from rakomqtt.bridge import run_bridge
 from rakomqtt.const import __version__, REQUIRED_PYTHON_VER
 
 _LOGGER = logging.getLogger(__name__)
+SUPERVISOR_OPTIONS_PATH = Path('/data/options.json')
+SHUTDOWN_SIGNALS = (signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     debug: bool
     rako_bridge_host: Optional[str]
@@ -83,17 +92,18 @@ def get_args() -> AppConfig:
 
     args = parser.parse_args()
 
-    if os.path.exists('/data/options.json'):
-        import json
-        with open('/data/options.json') as f:
-            options = json.load(f)
-            # Override arguments with options from Supervisor
-            args.rako_bridge_host = options.get('rako_bridge_host', args.rako_bridge_host)
-            args.mqtt_host = options.get('mqtt_host', args.mqtt_host)
-            args.mqtt_user = options.get('mqtt_user', args.mqtt_user)
-            args.mqtt_password = options.get('mqtt_password', args.mqtt_password)
-            args.debug = options.get('debug', args.debug)
-            args.default_fade_rate = options.get('default_fade_rate', args.default_fade_rate)
+    try:
+        options = json.loads(SUPERVISOR_OPTIONS_PATH.read_bytes())
+    except FileNotFoundError:
+        pass
+    else:
+        # Override arguments with options from Supervisor
+        args.rako_bridge_host = options.get('rako_bridge_host', args.rako_bridge_host)
+        args.mqtt_host = options.get('mqtt_host', args.mqtt_host)
+        args.mqtt_user = options.get('mqtt_user', args.mqtt_user)
+        args.mqtt_password = options.get('mqtt_password', args.mqtt_password)
+        args.debug = options.get('debug', args.debug)
+        args.default_fade_rate = options.get('default_fade_rate', args.default_fade_rate)
 
     return AppConfig(
         debug=args.debug,
@@ -161,6 +171,14 @@ async def shutdown(signal: signal.Signals, loop: asyncio.AbstractEventLoop) -> N
 
     _LOGGER.info("Shutdown complete")
 
+def handle_signal(sig: signal.Signals, loop: asyncio.AbstractEventLoop) -> None:
+    """Start a graceful shutdown on the first signal received."""
+    # Only the first signal triggers a shutdown; a repeated signal then
+    # gets the default behaviour and terminates the process.
+    for s in SHUTDOWN_SIGNALS:
+        loop.remove_signal_handler(s)
+    loop.create_task(shutdown(sig, loop), name=f"shutdown-{sig.name}")
+
 async def run() -> NoReturn | None:
     """Run the application."""
     validate_python()
@@ -171,20 +189,14 @@ async def run() -> NoReturn | None:
 
     # Get the event loop
     loop = asyncio.get_running_loop()
+    _LOGGER.debug('Using %s.%s event loop', type(loop).__module__, type(loop).__name__)
 
     # Add shutdown flag attribute
     setattr(loop, 'shutdown_flag', False)
 
     # Setup signal handlers
-    signals = (signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
-    for sig in signals:
-        loop.add_signal_handler(
-            sig,
-            lambda s=sig: asyncio.create_task(
-                shutdown(s, loop),
-                name=f"shutdown-{s.name}"
-            )
-        )
+    for sig in SHUTDOWN_SIGNALS:
+        loop.add_signal_handler(sig, handle_signal, sig, loop)
 
     try:
         await run_bridge(
@@ -210,6 +222,9 @@ def main() -> NoReturn | None:
         if sys.platform == "win32":
             loop = asyncio.ProactorEventLoop()
             asyncio.set_event_loop(loop)
+        elif uvloop is not None:
+            loop = uvloop.new_event_loop()
+            asyncio.set_event_loop(loop)
         else:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -1,53 +1,132 @@
 import asyncio
-import json
 import logging
-from typing import Optional, List, Tuple, Dict, Any, Final
-from collections.abc import AsyncIterator
+from typing import Optional, List, Tuple, Dict, Any, Final, Union
+from collections.abc import AsyncIterator, Awaitable, Callable
 import socket
-from contextlib import AsyncExitStack, asynccontextmanager
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 import paho.mqtt.client as mqtt
+from functools import lru_cache
 
 from rakomqtt.RakoBridge import RakoBridge, RakoCommand
 from rakomqtt.discovery import RakoDiscovery
 
+try:
+    # orjson is an optional, faster serializer; it returns bytes
+    from orjson import dumps as json_dumps
+except ImportError:
+    from json import dumps as json_dumps
+
 _LOGGER = logging.getLogger(__name__)
 
+# Retained bridge availability; "online" is published on every (re)connect
+# and the broker publishes the "offline" will if the connection drops
+AVAILABILITY_TOPIC: Final[str] = "rako/bridge/status"
+# Pre-encoded so paho doesn't re-encode them on every publish
+AVAILABILITY_ONLINE: Final[bytes] = b"online"
+AVAILABILITY_OFFLINE: Final[bytes] = b"offline"
+# Keepalive in seconds, which also bounds how long a dead connection can
+# go unnoticed before the will fires
+MQTT_KEEPALIVE: Final[int] = 30
+# Bounds in seconds for paho's reconnect delay, which doubles per attempt
+MQTT_RECONNECT_MIN_DELAY: Final[int] = 1
+MQTT_RECONNECT_MAX_DELAY: Final[int] = 600
+# Bound on queued inbound MQTT messages; once full the oldest is dropped
+QUEUE_MAXSIZE: Final[int] = 1024
+# How long status updates are gathered so repeats for a topic collapse
+STATUS_COALESCE_INTERVAL: Final[float] = 0.05
+# A repeat of the last retained state for a topic within this many seconds
+# (e.g. the same level rebroadcast during a fade) is not published again
+STATUS_DEDUPE_WINDOW: Final[float] = 1
+# Fallback scene cache poll period, and the pause after status traffic
+# before the cache is refetched
+SCENE_CACHE_POLL_INTERVAL: Final[float] = 30
+SCENE_CACHE_SETTLE_DELAY: Final[float] = 1
+# Backoff bounds for restarting a bridge worker that failed
+WORKER_RESTART_INITIAL_DELAY: Final[float] = 1
+WORKER_RESTART_MAX_DELAY: Final[float] = 60
+
+
+def _put_drop_oldest(queue: asyncio.Queue, item: Any) -> None:
+    """Queue an item without blocking, discarding the oldest one if full."""
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        _LOGGER.warning("Queue full, dropped the oldest entry")
+        queue.put_nowait(item)
+
+
+@lru_cache(maxsize=256)
+def _room_state_topic(room_id: int) -> str:
+    """Return the room level state topic used for scene cache updates."""
+    return f"rako/room/{room_id}/state"
+
+@lru_cache(maxsize=512)
+def _channel0_topic(topic: str) -> Optional[str]:
+    """Return the channel 0 state topic mirroring a channel state topic, if any."""
+    if '/channel/' not in topic or topic.endswith('/channel/0/state'):
+        return None
+    room_id = topic.split('/')[2]
+    return f"rako/room/{room_id}/channel/0/state"
+
+@lru_cache(maxsize=32)
+def _scene_cache_payload(scene_id: int) -> Union[str, bytes]:
+    """Return the encoded scene cache payload for a scene number."""
+    return json_dumps({
+        "state": "ON" if scene_id > 0 else "OFF",
+        "scene": scene_id,
+        "source": "scene_cache"
+    })
+
+
 class AsyncioMQTTClient:
+    PUBLISH_BATCH_YIELD: Final[int] = 32
+
     def __init__(self, host: str, user: str, password: str):
         self.client = mqtt.Client(protocol=mqtt.MQTTv5)
         self.client.username_pw_set(user, password)
         self.client.enable_logger()
+        self.client.reconnect_delay_set(
+            min_delay=MQTT_RECONNECT_MIN_DELAY,
+            max_delay=MQTT_RECONNECT_MAX_DELAY
+        )
+        _LOGGER.info("MQTT reconnect backoff: min=%ss max=%ss",
+                     MQTT_RECONNECT_MIN_DELAY, MQTT_RECONNECT_MAX_DELAY)
         self.client.on_connect = self._on_connect
         self.client.on_message = self._on_message
         self.client.on_subscribe = self._on_subscribe
         self.client.on_publish = self._on_publish
+        self.client.on_socket_open = self._on_socket_open
         self.host = host
         self.connected = asyncio.Event()
-        self._message_queue: asyncio.Queue[mqtt.MQTTMessage] = asyncio.Queue()
+        self._message_queue: asyncio.Queue[mqtt.MQTTMessage] = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
         self.is_connected = False
-        self._thread_pool = ThreadPoolExecutor(max_workers=1)
         self._queue_task: Optional[asyncio.Task] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Called on the event loop after each successful (re)connect
+        self.on_connected: Optional[Callable[[], None]] = None
 
     def _on_connect(self, client: mqtt.Client, userdata: Any, flags: Dict, 
                    rc: int, properties: Optional[Any] = None) -> None:
         """Handle connection established callback."""
         _LOGGER.info(f"MQTT Connected with result code {rc}")
         if properties:
-            _LOGGER.debug(f"Connection properties: {properties}")
+            _LOGGER.debug("Connection properties: %s", properties)
         self.is_connected = True
-        asyncio.run_coroutine_threadsafe(self._set_connected(), self._loop)
-
-    async def _set_connected(self) -> None:
-        """Set the connected event."""
-        self.connected.set()
+        if rc == 0:
+            # Birth message; replaces the will after a reconnect as well
+            client.publish(AVAILABILITY_TOPIC, AVAILABILITY_ONLINE, qos=1, retain=True)
+            if self.on_connected is not None:
+                self._loop.call_soon_threadsafe(self.on_connected)
+        self._loop.call_soon_threadsafe(self.connected.set)
 
     def _on_message(self, client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage) -> None:
         """Handle incoming message callback."""
-        _LOGGER.debug(f"Received MQTT message on topic {msg.topic}: {msg.payload}")
+        _LOGGER.debug("Received MQTT message on topic %s: %s", msg.topic, msg.payload)
         try:
-            asyncio.run_coroutine_threadsafe(self._message_queue.put(msg), self._loop)
+            # Hand the message to the event loop thread; a plain callback
+            # avoids wrapping every message in a coroutine and future
+            self._loop.call_soon_threadsafe(_put_drop_oldest, self._message_queue, msg)
         except Exception as e:
             _LOGGER.error(f"Error putting message in queue: {e}")
 
@@ -55,13 +134,23 @@ class AsyncioMQTTClient:
                      granted_qos: Optional[List[int]] = None, 
                      properties: Optional[Any] = None) -> None:
         """Handle subscription acknowledgment callback."""
-        _LOGGER.debug(f"Subscribed successfully: {mid}, QoS: {granted_qos}")
+        _LOGGER.debug("Subscribed successfully: %s, QoS: %s", mid, granted_qos)
         if properties:
-            _LOGGER.debug(f"Subscription properties: {properties}")
+            _LOGGER.debug("Subscription properties: %s", properties)
 
     def _on_publish(self, client: mqtt.Client, userdata: Any, mid: int) -> None:
         """Handle message published callback."""
-        _LOGGER.debug(f"Published message: {mid}")
+        _LOGGER.debug("Published message: %s", mid)
+
+    def _on_socket_open(self, client: mqtt.Client, userdata: Any, sock: Any) -> None:
+        """Tune each new broker connection, including reconnects."""
+        try:
+            # Commands and their PUBACKs are tiny; don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except (AttributeError, OSError) as e:
+            # Websocket and unix transports don't expose these options
+            _LOGGER.debug("Could not tune MQTT socket: %s", e)
 
     async def connect(self) -> None:
         """Connect to MQTT broker."""
@@ -69,16 +158,16 @@ class AsyncioMQTTClient:
             return
 
         self._loop = asyncio.get_running_loop()
-        _LOGGER.debug(f"Connecting to MQTT broker at {self.host}")
+        _LOGGER.debug("Connecting to MQTT broker at %s", self.host)
         
         self.client.will_set(
-            "rako/bridge/status",
-            "offline",
+            AVAILABILITY_TOPIC,
+            AVAILABILITY_OFFLINE,
             qos=1,
             retain=True
         )
         
-        self.client.connect(self.host, 1883, 60)
+        self.client.connect(self.host, 1883, MQTT_KEEPALIVE)
         self.client.loop_start()
 
     async def disconnect(self) -> None:
@@ -98,24 +187,42 @@ class AsyncioMQTTClient:
             
             self.client.loop_stop()
             self.client.disconnect()
-            self._thread_pool.shutdown(wait=False)
 
-    async def subscribe(self, topic: str, qos: int = 0) -> None:
-        """Subscribe to an MQTT topic."""
-        _LOGGER.debug(f"Subscribing to topic: {topic} with QoS {qos}")
-        result, mid = self.client.subscribe(topic, qos)
+    async def subscribe(self, topic: Union[str, List[Tuple[str, int]]], qos: int = 0) -> None:
+        """Subscribe to an MQTT topic, or to a list of (topic, qos) in one SUBSCRIBE."""
+        _LOGGER.debug("Subscribing to topic: %s with QoS %s", topic, qos)
+        if isinstance(topic, list):
+            result, mid = self.client.subscribe(topic)
+        else:
+            result, mid = self.client.subscribe(topic, qos)
         if result != mqtt.MQTT_ERR_SUCCESS:
             raise Exception(f"Failed to subscribe to {topic}: {result}")
-        _LOGGER.debug(f"Subscribe initiated with message ID: {mid}")
+        _LOGGER.debug("Subscribe initiated with message ID: %s", mid)
 
-    async def publish(self, topic: str, payload: Optional[str] = None, 
+    async def publish(self, topic: str, payload: Optional[Union[str, bytes]] = None, 
                      qos: int = 0, retain: bool = False) -> None:
         """Publish an MQTT message."""
-        _LOGGER.debug(f"Publishing to topic {topic}: {payload}")
+        _LOGGER.debug("Publishing to topic %s: %s", topic, payload)
         result, mid = self.client.publish(topic, payload, qos, retain)
         if result != mqtt.MQTT_ERR_SUCCESS:
             raise Exception(f"Failed to publish to {topic}: {result}")
-        _LOGGER.debug(f"Publish initiated with message ID: {mid}")
+        _LOGGER.debug("Publish initiated with message ID: %s", mid)
+
+    async def publish_batch(self, messages: List[Tuple[str, Optional[Union[str, bytes]]]],
+                            qos: int = 0, retain: bool = False) -> None:
+        """Queue several MQTT messages with paho in a single pass.
+
+        The network loop thread flushes them in the background; control is
+        handed back to the event loop every PUBLISH_BATCH_YIELD messages so
+        large batches don't starve other tasks.
+        """
+        _LOGGER.debug("Publishing batch of %s messages", len(messages))
+        for index, (topic, payload) in enumerate(messages, 1):
+            result, mid = self.client.publish(topic, payload, qos, retain)
+            if result != mqtt.MQTT_ERR_SUCCESS:
+                raise Exception(f"Failed to publish to {topic}: {result}")
+            if index % self.PUBLISH_BATCH_YIELD == 0:
+                await asyncio.sleep(0)
 
     async def get_message(self) -> mqtt.MQTTMessage:
         """Get the next message from the message queue."""
@@ -128,6 +235,40 @@ class AsyncioMQTTClient:
         except asyncio.TimeoutError:
             raise TimeoutError(f"Timeout waiting for MQTT connection to {self.host}")
 
+class RakoStatusProtocol(asyncio.DatagramProtocol):
+    """Turns Rako bridge status broadcasts into pending MQTT updates."""
+
+    def __init__(self, on_status: Callable[[str, Dict[str, Any]], None],
+                 status_seen: Optional[asyncio.Event] = None):
+        self.on_status = on_status
+        self.status_seen = status_seen
+        self.closed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        if not data:
+            return
+        try:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received UDP data: %s", data.hex(' '))
+            processed = RakoBridge.process_udp_bytes(data)
+
+            if processed:
+                topic, payload = processed
+                _LOGGER.debug("Processed UDP data: topic=%s, payload=%s", topic, payload)
+                self.on_status(topic, payload)
+                if self.status_seen is not None:
+                    self.status_seen.set()
+        except Exception as e:
+            _LOGGER.error("Error in watch_rako: %s", e, exc_info=True)
+
+    def error_received(self, exc: Exception) -> None:
+        _LOGGER.error("UDP receive error: %s", exc)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+
 class RakoMQTTBridge:
     MQTT_TOPICS: Final[List[Tuple[str, int]]] = [
         ("rako/room/+/channel/+/set", 1),
@@ -151,30 +292,57 @@ class RakoMQTTBridge:
             default_fade_rate=default_fade_rate
         )
         self.mqtt_client = AsyncioMQTTClient(mqtt_host, mqtt_user, mqtt_password)
-        self.udp_queue: asyncio.Queue[Tuple[str, Dict[str, Any]]] = asyncio.Queue()
+        # Latest unpublished status per topic; a burst for one topic
+        # collapses to its final state before it reaches the broker
+        self._pending_status: Dict[str, Dict[str, Any]] = {}
+        self._status_ready = asyncio.Event()
+        self._udp_transport: Optional[asyncio.DatagramTransport] = None
+        # Set whenever the bridge broadcasts a status change, so the scene
+        # cache is refreshed on activity rather than on a tight timer
+        self._scene_cache_dirty = asyncio.Event()
+        self._last_scene: Dict[int, int] = {}
+        # Last retained payload sent per state topic and when, to drop
+        # repeats; forgotten on reconnect in case the broker lost its retained state
+        self._last_published: Dict[str, Tuple[Union[str, bytes], float]] = {}
+        self.mqtt_client.on_connected = self._last_published.clear
 
     async def monitor_scene_cache(self) -> None:
-        """Monitor scene cache updates from bridge."""
+        """Monitor scene cache updates from bridge.
+
+        Not one of the bridge workers: it polls /scenes.htm over HTTP and
+        nothing subscribes to the room state topics it publishes.
+        """
         while True:
             try:
                 cache_entries = await self.rako_bridge.get_scene_cache()
                 for entry in cache_entries:
+                    # The retained message already holds an unchanged scene
+                    if self._last_scene.get(entry.room_id) == entry.scene_id:
+                        continue
+
                     # Publish scene status to MQTT
-                    topic = f"rako/room/{entry.room_id}/state"
-                    payload = {
-                        "state": "ON" if entry.scene_id > 0 else "OFF",
-                        "scene": entry.scene_id,
-                        "source": "scene_cache"
-                    }
                     await self.mqtt_client.publish(
-                        topic,
-                        json.dumps(payload),
+                        _room_state_topic(entry.room_id),
+                        _scene_cache_payload(entry.scene_id),
                         qos=1,
                         retain=True
                     )
+                    self._last_scene[entry.room_id] = entry.scene_id
             except Exception as e:
                 _LOGGER.error(f"Scene cache monitoring error: {e}")
-            await asyncio.sleep(5)  # Poll every 5 seconds
+
+            # Refresh once status traffic shows something changed, or as a
+            # fallback after SCENE_CACHE_POLL_INTERVAL
+            try:
+                await asyncio.wait_for(
+                    self._scene_cache_dirty.wait(),
+                    timeout=SCENE_CACHE_POLL_INTERVAL
+                )
+                # Let the rest of a scene change settle before fetching
+                await asyncio.sleep(SCENE_CACHE_SETTLE_DELAY)
+            except asyncio.TimeoutError:
+                pass
+            self._scene_cache_dirty.clear()
 
     @asynccontextmanager
     async def setup_udp_socket(self) -> AsyncIterator[socket.socket]:
@@ -193,67 +361,58 @@ class RakoMQTTBridge:
         """Listen for Rako bridge UDP broadcasts"""
         _LOGGER.info("Starting Rako UDP watcher")
         loop = asyncio.get_running_loop()
-        
-        while True:
-            try:
-                data = await loop.sock_recv(sock, 256)
-                if not data:
-                    await asyncio.sleep(0.1)
-                    continue
-                    
-                _LOGGER.debug(f"Received UDP data: {list(data)}")
-                processed = RakoBridge.process_udp_bytes(list(data))
-                
-                if processed:
-                    topic, payload = processed
-                    _LOGGER.debug(f"Processed UDP data: topic={topic}, payload={payload}")
-                    await self.udp_queue.put((topic, payload))
-            except Exception as e:
-                _LOGGER.error(f"Error in watch_rako: {e}", exc_info=True)
-                await asyncio.sleep(1)
+
+        # Datagrams are handed to the protocol straight from the loop's
+        # read callback instead of a sock_recv await per packet
+        transport, protocol = await loop.create_datagram_endpoint(
+            lambda: RakoStatusProtocol(self.queue_status, self._scene_cache_dirty),
+            sock=sock
+        )
+        self._udp_transport = transport
+        try:
+            await protocol.closed
+        finally:
+            transport.close()
+        # Shutdown cancels this task before closing the listener, so getting
+        # here means the socket went away underneath us
+        raise ConnectionError("Rako UDP listener closed")
 
     async def process_mqtt_messages(self) -> None:
         """Process incoming MQTT messages"""
         _LOGGER.info("Starting MQTT message processor")
 
-        # Log all subscriptions
+        # Log all subscriptions, then send them in a single SUBSCRIBE
         for topic, qos in self.MQTT_TOPICS:
             _LOGGER.info(f"Subscribing to topic: {topic}")
-            await self.mqtt_client.subscribe(topic, qos)
+        await self.mqtt_client.subscribe(self.MQTT_TOPICS)
 
         while True:
             _LOGGER.debug("Waiting for MQTT message...")
             message = await self.mqtt_client.get_message()
 
             # Add detailed logging of incoming messages
-            _LOGGER.debug(f"""MQTT Message received:
-                Topic: {message.topic}
-                Payload: {message.payload}
-                QOS: {message.qos}
-                Retain: {message.retain}
-                """)
+            _LOGGER.debug("""MQTT Message received:
+                Topic: %s
+                Payload: %s
+                QOS: %s
+                Retain: %s
+                """, message.topic, message.payload, message.qos, message.retain)
 
             try:
-                if isinstance(message.payload, bytes):
-                    payload_str = message.payload.decode('utf-8')
-                else:
-                    payload_str = str(message.payload)
-
-                _LOGGER.debug(f"Decoded payload: {payload_str}")
-
+                # from_mqtt parses the raw bytes itself
                 rako_command = RakoCommand.from_mqtt(
                     message.topic,
-                    payload_str
+                    message.payload
                 )
 
                 if rako_command:
-                    _LOGGER.info(f"Sending command to Rako bridge: {rako_command}")
+                    _LOGGER.info("Sending command to Rako bridge: %s", rako_command)
                     # Fix: Await the post_command coroutine
                     await self.rako_bridge.post_command(rako_command)
                 else:
-                    _LOGGER.warning(f"Could not create RakoCommand from message: {message.topic} {payload_str}")
+                    _LOGGER.warning("Could not create RakoCommand from message: %s %r", message.topic, message.payload)
             except Exception as e:
-                _LOGGER.error(f"Error processing MQTT message: {e}", exc_info=True)
+                _LOGGER.error("Error processing MQTT message: %s", e, exc_info=True)
 
 
     async def publish_status_updates(self) -> None:
@@ -261,56 +420,51 @@ class RakoMQTTBridge:
         _LOGGER.info("Starting status update publisher")
         while True:
             try:
-                topic, payload = await self.udp_queue.get()
-                _LOGGER.debug(f"Publishing status update: topic={topic}, payload={payload}")
-
-                # Use topic directly as it already includes /state
-                await self.mqtt_client.publish(
-                    topic,
-                    json.dumps(payload),
-                    qos=1,
-                    retain=True
-                )
-
-                # If this is a channel state update, also update channel 0 state
-                if '/channel/' in topic and not topic.endswith('/channel/0/state'):
-                    room_id = topic.split('/')[2]
-                    channel0_topic = f"rako/room/{room_id}/channel/0/state"
-                    await self.mqtt_client.publish(
-                        channel0_topic,
-                        json.dumps(payload),
-                        qos=1,
-                        retain=True
-                    )
+                await self._status_ready.wait()
+
+                # Let the rest of a burst arrive, then take whatever is
+                # pending; later updates for a topic already replaced earlier ones
+                await asyncio.sleep(STATUS_COALESCE_INTERVAL)
+                self._status_ready.clear()
+                pending, self._pending_status = self._pending_status, {}
+
+                for topic, payload in pending.items():
+                    encoded = json_dumps(payload)
+                    # Every button press is an event, even a repeat of the last one
+                    dedupe = payload.get("event") != "button_press"
+
+                    # Use topic directly as it already includes /state
+                    await self._publish_state(topic, encoded, dedupe)
+
+                    # If this is a channel state update, also update channel 0 state
+                    channel0_topic = _channel0_topic(topic)
+                    if channel0_topic is not None:
+                        await self._publish_state(channel0_topic, encoded, dedupe)
             except Exception as e:
                 _LOGGER.error(f"Error publishing status: {e}")
                 await asyncio.sleep(1)
 
-    async def maintain_availability(self) -> None:
-        """Maintain bridge availability status"""
-        _LOGGER.info("Starting availability maintenance")
-        availability_topic = "rako/bridge/status"
-        while True:
-            try:
-                await self.mqtt_client.publish(
-                    availability_topic,
-                    "online",
-                    qos=1,
-                    retain=True
-                )
-                await asyncio.sleep(60)
-            except Exception as e:
-                _LOGGER.error(f"Error in availability maintenance: {e}", exc_info=True)
-                try:
-                    await self.mqtt_client.publish(
-                        availability_topic,
-                        "offline",
-                        qos=1,
-                        retain=True
-                    )
-                except:
-                    pass
-                raise
+    def queue_status(self, topic: str, payload: Dict[str, Any]) -> None:
+        """Record the latest status for a topic and wake the publisher."""
+        self._pending_status[topic] = payload
+        self._status_ready.set()
+
+    async def _publish_state(self, topic: str, encoded: Union[str, bytes], dedupe: bool = True) -> None:
+        """Publish a retained state unless it repeats what was just sent for the topic."""
+        now = asyncio.get_running_loop().time()
+        last = self._last_published.get(topic)
+        if dedupe and last is not None and last[0] == encoded and now - last[1] < STATUS_DEDUPE_WINDOW:
+            _LOGGER.debug("Skipping unchanged status update: topic=%s", topic)
+            return
+
+        _LOGGER.debug("Publishing status update: topic=%s, payload=%s", topic, encoded)
+        await self.mqtt_client.publish(
+            topic,
+            encoded,
+            qos=1,
+            retain=True
+        )
+        self._last_published[topic] = (encoded, now)
 
     async def shutdown(self) -> None:
         """Perform graceful shutdown of the bridge."""
@@ -319,18 +473,18 @@ class RakoMQTTBridge:
         # Set bridge status to offline
         try:
             await self.mqtt_client.publish(
-                "rako/bridge/status",
-                "offline",
+                AVAILABILITY_TOPIC,
+                AVAILABILITY_OFFLINE,
                 qos=1,
                 retain=True
             )
         except Exception as e:
             _LOGGER.error(f"Error publishing offline status: {e}")
 
-        # Close UDP socket
-        if hasattr(self, '_socket'):
+        # Close UDP listener
+        if self._udp_transport is not None:
             try:
-                self._socket.close()
+                self._udp_transport.close()
             except Exception as e:
                 _LOGGER.error(f"Error closing UDP socket: {e}")
 
@@ -340,6 +494,12 @@ class RakoMQTTBridge:
         except Exception as e:
             _LOGGER.error(f"Error disconnecting MQTT: {e}")
 
+        # Close the UDP command endpoint and cache-polling HTTP session
+        try:
+            await self.rako_bridge.close()
+        except Exception as e:
+            _LOGGER.error("Error closing Rako bridge connections: %s", e)
+
         # Close telnet connection if exists
         if hasattr(self.rako_bridge, '_telnet') and self.rako_bridge._telnet:
             try:
@@ -349,60 +509,75 @@ class RakoMQTTBridge:
 
         _LOGGER.info("Shutdown completed")
 
+    def _workers(self) -> Dict[str, Callable[[], Awaitable[None]]]:
+        """Long-running bridge workers, keyed by task name."""
+        return {
+            "watch_rako": self._watch_status_broadcasts,
+            "process_mqtt": self.process_mqtt_messages,
+            "publish_status": self.publish_status_updates,
+        }
+
+    async def _watch_status_broadcasts(self) -> None:
+        """Bind a fresh UDP socket and listen on it until the listener fails."""
+        async with self.setup_udp_socket() as sock:
+            await self.watch_rako(sock)
+
+    async def _supervise(self, name: str, worker: Callable[[], Awaitable[None]]) -> None:
+        """Run a worker, restarting it with exponential backoff when it fails."""
+        loop = asyncio.get_running_loop()
+        delay = WORKER_RESTART_INITIAL_DELAY
+        while True:
+            started = loop.time()
+            try:
+                await worker()
+                _LOGGER.warning("%s stopped unexpectedly", name)
+            except Exception as e:
+                _LOGGER.error("%s failed: %s", name, e, exc_info=True)
+
+            # A worker that ran for a good while earns a fresh backoff
+            if loop.time() - started > WORKER_RESTART_MAX_DELAY:
+                delay = WORKER_RESTART_INITIAL_DELAY
+            _LOGGER.info("Restarting %s in %.0fs", name, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WORKER_RESTART_MAX_DELAY)
+
     async def run(self) -> None:
         """Run the combined bridge"""
         _LOGGER.info("Starting RakoMQTT Bridge")
-        tasks: List[asyncio.Task] = []
 
         try:
-            async with AsyncExitStack() as stack:
-                # Connect to MQTT
-                _LOGGER.info("Connecting to MQTT broker...")
-                await self.mqtt_client.connect()
-                await self.mqtt_client.wait_for_connection(timeout=10)
-                sock = await stack.enter_async_context(self.setup_udp_socket())
+            # Connect to MQTT
+            _LOGGER.info("Connecting to MQTT broker...")
+            await self.mqtt_client.connect()
+            async with RakoDiscovery(self.mqtt_client, self.rako_bridge.host) as discovery:
+                # rako.xml doesn't depend on the broker, so fetch it while
+                # the MQTT connection is still coming up. gather() re-raises
+                # the first failure as is, e.g. the connect timeout
+                startup = (
+                    asyncio.create_task(self.mqtt_client.wait_for_connection(timeout=10)),
+                    asyncio.create_task(discovery.async_prefetch_xml()),
+                )
+                try:
+                    await asyncio.gather(*startup)
+                finally:
+                    for task in startup:
+                        task.cancel()
+                    await asyncio.gather(*startup, return_exceptions=True)
                 _LOGGER.info("MQTT connection established")
 
-                discovery = RakoDiscovery(self.mqtt_client, self.rako_bridge.host)
                 await discovery.async_publish_discovery_configs()
 
-                # Create tasks
-                tasks = [
-                    asyncio.create_task(self.watch_rako(sock), name="watch_rako"),
-                    asyncio.create_task(self.process_mqtt_messages(), name="process_mqtt"),
-                    asyncio.create_task(self.publish_status_updates(), name="publish_status"),
-                    asyncio.create_task(self.maintain_availability(), name="maintain_availability"),
-                ]
-
-                # Wait for first task to complete or fail
-                done, pending = await asyncio.wait(
-                    tasks,
-                    return_when=asyncio.FIRST_COMPLETED
-                )
-
-                # Check if any task failed
-                for task in done:
-                    if task.exception():
-                        raise task.exception()
+            # Each worker restarts itself after a failure; the task group
+            # only ends when the workers are cancelled
+            async with asyncio.TaskGroup() as tg:
+                for name, worker in self._workers().items():
+                    tg.create_task(self._supervise(name, worker), name=name)
 
         except Exception as e:
             _LOGGER.error(f"Bridge crashed: {e}", exc_info=True)
             raise
         finally:
             _LOGGER.info("Starting cleanup")
-            # Cancel all running tasks
-            for task in tasks:
-                if not task.done():
-                    _LOGGER.debug(f"Cancelling task: {task.get_name()}")
-                    task.cancel()
-
-            if tasks:
-                # Wait for tasks to complete with timeout
-                try:
-                    await asyncio.wait(tasks, timeout=5)
-                except asyncio.TimeoutError:
-                    _LOGGER.warning("Some tasks did not shut down cleanly")
-
             # Perform graceful shutdown
             await self.shutdown()
 
@@ -426,8 +601,8 @@ async def run_bridge(
     finally:
         try:
             await bridge.mqtt_client.publish(
-                "rako/bridge/status",
-                "offline",
+                AVAILABILITY_TOPIC,
+                AVAILABILITY_OFFLINE,
                 qos=1,
                 retain=True
             )
@@ -1,15 +1,28 @@
 """Device discovery and configuration for Rako integration."""
 import json
 import logging
-from typing import List, Dict, Any, Optional, Final, Tuple
+from typing import List, Dict, Any, Optional, Final, Tuple, Union
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
+from operator import attrgetter
+from functools import lru_cache
 import aiohttp
 from aiohttp.client_exceptions import ClientError
 
+try:
+    # orjson is an optional, faster serializer; it returns bytes
+    from orjson import dumps as json_dumps
+except ImportError:
+    from json import dumps as json_dumps
+
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+_ID_KEY = attrgetter('id')
+
+# Read size while streaming rako.xml into the parser
+XML_CHUNK_SIZE: Final[int] = 16384
+
+@dataclass(frozen=True, slots=True)
 class RakoBridgeInfo:
     """Rako bridge information from XML."""
     version: str
@@ -20,19 +33,19 @@ class RakoBridgeInfo:
     hw_status: str
     db_version: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RakoChannel:
     id: int
     name: str
     type: str
     levels: Optional[str] = None  # Hex string of levels for scenes
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RakoScene:
     id: int
     name: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RakoRoom:
     id: int
     name: str
@@ -42,6 +55,36 @@ class RakoRoom:
     channels: List[RakoChannel] = field(default_factory=list)
 
 
+# Availability and QoS settings shared by every discovery config
+BASE_SCHEMA: Final[Dict[str, Any]] = {
+    "availability_topic": "rako/bridge/status",
+    "payload_available": "online",
+    "payload_not_available": "offline",
+    "optimistic": False,
+    "qos": 1
+}
+
+
+def _compile_type_config(
+    type_config: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Tuple[str, str]]]:
+    """Split a type config into static values and "~" topic templates.
+
+    The static values are merged over BASE_SCHEMA. Templates are stored as
+    (prefix, suffix) pairs around the "~" so the base topic can be spliced
+    in with a single concatenation.
+    """
+    base_config: Dict[str, Any] = dict(BASE_SCHEMA)
+    topic_templates: Dict[str, Tuple[str, str]] = {}
+    for key, value in type_config.items():
+        if isinstance(value, str) and "~" in value:
+            prefix, suffix = value.split("~", 1)
+            topic_templates[key] = (prefix, suffix)
+        else:
+            base_config[key] = value
+    return base_config, topic_templates
+
+
 class RakoDeviceType:
     """Mapping between Rako and Home Assistant device types."""
     
@@ -115,239 +158,304 @@ class RakoDeviceType:
         })
     }
 
+    # Rako type -> (ha_type, base config, topic templates)
+    COMPILED_MAPPINGS: Final[Dict[str, Tuple[str, Dict[str, Any], Dict[str, Tuple[str, str]]]]] = {
+        rako_type: (ha_type, *_compile_type_config(type_config))
+        for rako_type, (ha_type, type_config) in MAPPINGS.items()
+    }
+    _DEFAULT_MAPPING: Final[Tuple[str, Dict[str, Any], Dict[str, Tuple[str, str]]]] = COMPILED_MAPPINGS["default"]
+
     @classmethod
-    def get_mapping(cls, rako_type: str) -> Tuple[str, Dict[str, Any]]:
-        """Get Home Assistant device type and config for Rako type."""
-        rako_type = rako_type.lower()
-        if rako_type in cls.MAPPINGS:
-            return cls.MAPPINGS[rako_type]
-        # Default to switch if type is unknown
-        _LOGGER.warning(f"Unknown Rako device type: {rako_type}, defaulting to switch")
-        return cls.MAPPINGS["default"]
+    @lru_cache(maxsize=32)
+    def get_mapping(cls, rako_type: str) -> Tuple[str, Dict[str, Any], Dict[str, Tuple[str, str]]]:
+        """Get Home Assistant device type and compiled config for Rako type.
+
+        rako_type must already be lowercase; channel types are lowercased at
+        parse time and room types once per room during discovery. Results
+        are memoized, so an unknown type is only warned about once.
+        """
+        mapping = cls.COMPILED_MAPPINGS.get(rako_type)
+        if mapping is None:
+            # Default to switch if type is unknown
+            _LOGGER.warning("Unknown Rako device type: %s, defaulting to switch", rako_type)
+            return cls._DEFAULT_MAPPING
+        return mapping
 
 class RakoDiscovery:
     """Handle device discovery for Rako integration."""
 
     TIMEOUT: Final[int] = 5
-    BASE_SCHEMA: Final[Dict[str, Any]] = {
-        "availability_topic": "rako/bridge/status",
-        "payload_available": "online",
-        "payload_not_available": "offline",
-        "optimistic": False,
-        "qos": 1
-    }
 
     def __init__(self, mqtt_client: Any, rako_bridge_host: str):
         self.mqtt_client = mqtt_client
         self.rako_bridge_host = rako_bridge_host
+        # Identifier of the bridge device; every room device links to it
+        self._bridge_identifier = f"rako_bridge_{rako_bridge_host}"
         self.device_base_info = {
-            "identifiers": [f"rako_bridge_{self.rako_bridge_host}"],
+            "identifiers": [self._bridge_identifier],
             "name": "Rako Bridge",
             "model": "RA-BRIDGE",
             "manufacturer": "Rako",
             "sw_version": "rakomqtt"
         }
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._xml_root: Optional[ET.Element] = None
 
     async def publish_config(self, discovery_topic: str, config: Dict[str, Any]) -> None:
         """Helper method to publish discovery config."""
         await self.mqtt_client.publish(
             discovery_topic,
-            json.dumps(config),
+            json_dumps(config),
             qos=1,
             retain=True
         )
 
-    async def _test_bridge_connectivity(self) -> None:
-        """Test connectivity to the Rako bridge."""
-        _LOGGER.debug("Testing connection to Rako bridge...")
-        async with aiohttp.ClientSession() as session:
-            url = f"http://{self.rako_bridge_host}/rako.xml"
-            async with session.get(url, timeout=self.TIMEOUT) as response:
-                response.raise_for_status()
-                _LOGGER.debug("Successfully connected to Rako bridge")
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT)
+            )
+        return self._session
+
+    async def _fetch_xml(self) -> ET.Element:
+        """Fetch and parse rako.xml once, reusing the parsed tree afterwards."""
+        if self._xml_root is not None:
+            return self._xml_root
+
+        session = await self._get_session()
+        _LOGGER.debug("Fetching rako.xml from bridge...")
+        url = f"http://{self.rako_bridge_host}/rako.xml"
+        # Feed expat the raw bytes as they arrive, so parsing overlaps the
+        # download; it honours the XML declaration's encoding itself
+        parser = ET.XMLParser()
+        length = 0
+        async with session.get(url) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(XML_CHUNK_SIZE):
+                parser.feed(chunk)
+                length += len(chunk)
+            _LOGGER.debug("Received XML content (length: %s)", length)
+
+        self._xml_root = parser.close()
+        _LOGGER.debug("Successfully parsed XML")
+        return self._xml_root
+
+    async def async_prefetch_xml(self) -> None:
+        """Download rako.xml ahead of discovery, e.g. while MQTT connects."""
+        await self._fetch_xml()
+
+    async def aclose(self) -> None:
+        """Close the HTTP session and drop the cached XML tree."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._xml_root = None
+
+    async def __aenter__(self) -> 'RakoDiscovery':
+        """Async context manager entry; opens the shared HTTP session."""
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.aclose()
 
     async def _async_get_bridge_info(self) -> RakoBridgeInfo:
         """Get bridge version and info from XML."""
-        async with aiohttp.ClientSession() as session:
-            url = f"http://{self.rako_bridge_host}/rako.xml"
-            async with session.get(url) as response:
-                content = await response.text()
-                root = ET.fromstring(content)
-                info = root.find('info')
-
-                return RakoBridgeInfo(
-                    version=info.findtext('version', ''),
-                    build_date=info.findtext('buildDate', ''),
-                    host_name=info.findtext('hostName', '').strip(),
-                    host_ip=info.findtext('hostIP', ''),
-                    host_mac=info.findtext('hostMAC', ''),
-                    hw_status=info.findtext('hwStatus', ''),
-                    db_version=info.findtext('dbVersion', '')
-                )
+        root = await self._fetch_xml()
+        texts = self._child_texts(root.find('info'))
+
+        return RakoBridgeInfo(
+            version=texts.get('version', ''),
+            build_date=texts.get('buildDate', ''),
+            host_name=texts.get('hostName', '').strip(),
+            host_ip=texts.get('hostIP', ''),
+            host_mac=texts.get('hostMAC', ''),
+            hw_status=texts.get('hwStatus', ''),
+            db_version=texts.get('dbVersion', '')
+        )
 
     async def _async_get_rooms_from_bridge(self) -> List[RakoRoom]:
-        """Fetch and parse room configuration from the bridge."""
+        """Parse room configuration from the bridge XML."""
         _LOGGER.debug("Fetching room configuration from bridge...")
-        async with aiohttp.ClientSession() as session:
-            url = f"http://{self.rako_bridge_host}/rako.xml"
-            async with session.get(url, timeout=self.TIMEOUT) as response:
-                content = await response.text()
-                _LOGGER.debug(f"Received XML content (length: {len(content)})")
-
-        root = ET.fromstring(content)
-        _LOGGER.debug("Successfully parsed XML")
+        root = await self._fetch_xml()
         rooms: List[RakoRoom] = []
-        
-        for room_elem in root.findall('.//Room'):
+        # rako.xml normally lists rooms in id order; only sort if it doesn't
+        in_order = True
+
+        for room_elem in root.iter('Room'):
             try:
                 room = self._parse_room_element(room_elem)
                 if room:
+                    if rooms and room.id < rooms[-1].id:
+                        in_order = False
                     rooms.append(room)
             except Exception as e:
-                _LOGGER.error(f"Failed to process room element: {e}")
+                _LOGGER.error("Failed to process room element: %s", e)
                 continue
 
-        return sorted(rooms, key=lambda x: x.id)
+        if not in_order:
+            rooms.sort(key=_ID_KEY)
+        return rooms
 
     def _parse_scene_element(self, scene_elem: ET.Element) -> Optional[RakoScene]:
         """Parse a scene element from the XML."""
+        # The id is the only field that can be malformed
         try:
             scene_id = int(scene_elem.get('id', '0'))
-            scene_name = scene_elem.findtext('Name', f'Scene {scene_id}')
-            return RakoScene(id=scene_id, name=scene_name)
-        except Exception as e:
-            _LOGGER.error(f"Failed to parse scene element: {e}")
+        except ValueError as e:
+            _LOGGER.error("Failed to parse scene element: %s", e)
             return None
+        scene_name = scene_elem.findtext('Name', f'Scene {scene_id}')
+        return RakoScene(id=scene_id, name=scene_name)
+
+    @staticmethod
+    def _child_texts(elem: ET.Element) -> Dict[str, str]:
+        """Map child tags to their text in a single pass over the element.
+
+        Like findtext, the first child with a given tag wins and a child
+        without text maps to ''.
+        """
+        texts: Dict[str, str] = {}
+        for child in elem:
+            texts.setdefault(child.tag, child.text or '')
+        return texts
 
     def _parse_channel_element(self, channel_elem: ET.Element) -> Optional[RakoChannel]:
         """Parse a channel element from the XML."""
         try:
             channel_id = int(channel_elem.get('id', '0'))
-            channel_name = channel_elem.findtext('Name', f'Channel {channel_id}')
-            channel_type = channel_elem.findtext('type', 'unknown').lower()
-            levels = channel_elem.findtext('Levels')
-            
-            return RakoChannel(
-                id=channel_id,
-                name=channel_name,
-                type=channel_type,
-                levels=levels
-            )
-        except Exception as e:
-            _LOGGER.error(f"Failed to parse channel element: {e}")
+        except ValueError as e:
+            _LOGGER.error("Failed to parse channel element: %s", e)
             return None
+        texts = self._child_texts(channel_elem)
+        channel_name = texts.get('Name', f'Channel {channel_id}')
+        channel_type = texts.get('type', 'unknown').lower()
+        levels = texts.get('Levels')
+
+        return RakoChannel(
+            id=channel_id,
+            name=channel_name,
+            type=channel_type,
+            levels=levels
+        )
 
     def _parse_room_element(self, room_elem: ET.Element) -> Optional[RakoRoom]:
         """Parse a room element from the XML."""
         try:
             room_id = int(room_elem.get('id', '0'))
-            room_type = room_elem.findtext('Type', 'Unknown')
-            room_name = room_elem.findtext('Title', f'Room {room_id}')
-            room_mode = room_elem.findtext('mode')
-            
-            # Parse scenes
-            scenes = {}
-            for scene_elem in room_elem.findall('Scene'):
-                scene = self._parse_scene_element(scene_elem)
+        except ValueError as e:
+            _LOGGER.error("Failed to parse room element: %s", e)
+            return None
+
+        # Walk the children once, parsing scenes and channels as we go
+        texts: Dict[str, str] = {}
+        scenes = {}
+        channels = []
+        in_order = True
+        for child in room_elem:
+            tag = child.tag
+            if tag == 'Scene':
+                scene = self._parse_scene_element(child)
                 if scene:
                     scenes[scene.id] = scene.name
-            
-            # Parse channels
-            channels = []
-            for channel_elem in room_elem.findall('Channel'):
-                channel = self._parse_channel_element(channel_elem)
+            elif tag == 'Channel':
+                channel = self._parse_channel_element(child)
                 if channel:
+                    if channels and channel.id < channels[-1].id:
+                        in_order = False
                     channels.append(channel)
-
-            return RakoRoom(
-                id=room_id,
-                name=room_name,
-                type=room_type,
-                mode=room_mode,
-                scenes=scenes,
-                channels=sorted(channels, key=lambda x: x.id)
-            )
-        except Exception as e:
-            _LOGGER.error(f"Failed to parse room element: {e}")
-            return None
+            else:
+                texts.setdefault(tag, child.text or '')
+
+        room_type = texts.get('Type', 'Unknown')
+        room_name = texts.get('Title', f'Room {room_id}')
+        room_mode = texts.get('mode')
+        if not in_order:
+            channels.sort(key=_ID_KEY)
+
+        return RakoRoom(
+            id=room_id,
+            name=room_name,
+            type=room_type,
+            mode=room_mode,
+            scenes=scenes,
+            channels=channels
+        )
 
     async def _async_publish_room_config(self, room: RakoRoom) -> None:
         """Publish discovery configuration for a room."""
-        _LOGGER.debug(f"Publishing room config for room {room.id} ({room.type})")
+        _LOGGER.debug("Publishing room config for room %s (%s)", room.id, room.type)
         # We really do skip room-level config now
         return
 
-    async def _async_publish_channel_config(self, room: RakoRoom, channel: RakoChannel) -> None:
-        """Publish discovery configuration for a specific channel."""
+    def _build_room_device_info(self, room: RakoRoom) -> Dict[str, Any]:
+        """Build the Home Assistant device entry shared by a room's channels."""
+        return {
+            "identifiers": [f"rako_room_{room.id}"],
+            "name": room.name,
+            "model": f"Rako {room.type}",
+            "manufacturer": "Rako",
+            "sw_version": "rakomqtt",
+            "via_device": self._bridge_identifier,  # Link to bridge as parent device
+        }
+
+    def _build_channel_config(self, room: RakoRoom, channel: RakoChannel,
+                              room_type: str, room_device_info: Dict[str, Any]
+                              ) -> Tuple[str, Dict[str, Any]]:
+        """Build the discovery topic and configuration for a specific channel.
+
+        room_type (the lowercased room.type) and room_device_info are
+        resolved once per room and shared by all of its channels.
+        """
         try:
             # Determine device type based on channel and room
             if channel.id == 0:
                 # For channel 0, use room type
-                device_type = room.type
+                device_type = room_type
                 display_name = f"{room.name} (All)"
             else:
                 # For specific channels, use channel type if not Default, otherwise use room type
-                device_type = channel.type if channel.type.lower() != "default" else room.type
+                device_type = channel.type if channel.type != "default" else room_type
                 display_name = f"{channel.name}"
 
-            ha_type, type_config = RakoDeviceType.get_mapping(device_type)
+            ha_type, base_config, topic_templates = RakoDeviceType.get_mapping(device_type)
             unique_id = f"rako_room_{room.id}_channel_{channel.id}"
 
             base_topic = f"rako/room/{room.id}/channel/{channel.id}"
 
-            room_device_info = {
-                "identifiers": [f"rako_room_{room.id}"],
-                "name": room.name,
-                "model": f"Rako {room.type}",
-                "manufacturer": "Rako",
-                "sw_version": "rakomqtt",
-                "via_device": f"rako_bridge_{self.rako_bridge_host}",  # Link to bridge as parent device
-            }
-
-            # Replace ~ with actual base topic in type_config
-            processed_config = {}
-            for key, value in type_config.items():
-                if isinstance(value, str) and "~" in value:
-                    processed_config[key] = value.replace("~", base_topic)
-                else:
-                    processed_config[key] = value
-
             config = {
                 "name": display_name,
                 "unique_id": unique_id,
                 "state_topic": f"{base_topic}/state",
                 "command_topic": f"{base_topic}/set",
                 "device": room_device_info,
-                **self.BASE_SCHEMA,
-                **processed_config
             }
+            config.update(base_config)
+            # Splice the base topic into the precompiled ~ templates
+            for key, (prefix, suffix) in topic_templates.items():
+                config[key] = prefix + base_topic + suffix
 
-            _LOGGER.debug(f"Publishing discovery config for {display_name}:")
-            _LOGGER.debug(json.dumps(config, indent=2))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Built discovery config for %s:\n%s",
+                              display_name, json.dumps(config, indent=2))
 
-            discovery_topic = f"homeassistant/{ha_type}/{unique_id}/config"
-            await self.publish_config(discovery_topic, config)
-            _LOGGER.debug(f"Published {ha_type} device config for {display_name}")
+            return f"homeassistant/{ha_type}/{unique_id}/config", config
 
         except Exception as e:
-            _LOGGER.error(f"Failed to publish channel config: {e}")
+            _LOGGER.error("Failed to build channel config: %s", e)
             raise
 
     async def async_publish_discovery_configs(self) -> None:
         """Query Rako bridge and publish discovery info for all devices."""
-        _LOGGER.info(f"Starting discovery for Rako bridge at {self.rako_bridge_host}")
+        _LOGGER.info("Starting discovery for Rako bridge at %s", self.rako_bridge_host)
 
         try:
             # Get bridge info first
             bridge_info = await self._async_get_bridge_info()
 
-            # Update device info with actual bridge version
-            self.device_base_info.update({
-                "sw_version": bridge_info.version,
-                "hw_version": bridge_info.hw_status,
-                "configuration_url": f"http://{self.rako_bridge_host}"
-            })
-
             # Publish bridge device info
             await self.publish_config(
                 "homeassistant/device/rako_bridge/config",
@@ -362,31 +470,41 @@ class RakoDiscovery:
                 }
             )
 
-            await self._test_bridge_connectivity()
             rooms = await self._async_get_rooms_from_bridge()
-            _LOGGER.info(f"Found {len(rooms)} rooms in bridge configuration")
+            _LOGGER.info("Found %s rooms in bridge configuration", len(rooms))
 
+            # Collect every channel config, then hand them to MQTT in one batch
+            configs: List[Tuple[str, Union[str, bytes]]] = []
             for room in rooms:
-                _LOGGER.debug(f"Processing room: {room}")
+                _LOGGER.debug("Processing room %s (%s) with %s channels", room.id, room.name, len(room.channels))
                 try:
                     # Skip room config as we're only using channel interface
 
                     # Process all channels including channel 0
-                    await self._async_publish_channel_config(
-                        room,
-                        RakoChannel(0, "All Channels", "master")
-                    )
-                    for channel in room.channels:
-                        await self._async_publish_channel_config(room, channel)
+                    room_type = room.type.lower()
+                    room_device_info = self._build_room_device_info(room)
+                    room_configs = [
+                        self._build_channel_config(room, channel, room_type, room_device_info)
+                        for channel in (RakoChannel(0, "All Channels", "master"), *room.channels)
+                    ]
                 except Exception as e:
-                    _LOGGER.error(f"Failed to process room {room.id}: {e}")
+                    _LOGGER.error("Failed to process room %s: %s", room.id, e)
                     continue
+                configs.extend(
+                    (discovery_topic, json_dumps(config))
+                    for discovery_topic, config in room_configs
+                )
+
+            await self.mqtt_client.publish_batch(configs, qos=1, retain=True)
+            _LOGGER.debug("Published %s channel configs", len(configs))
 
             _LOGGER.info("Discovery configuration completed successfully")
 
         except ClientError as e:
-            _LOGGER.error(f"HTTP connection error during discovery: {e}")
+            _LOGGER.error("HTTP connection error during discovery: %s", e)
             raise
         except Exception as e:
-            _LOGGER.error(f"Failed to complete discovery: {e}", exc_info=True)
+            _LOGGER.error("Failed to complete discovery: %s", e, exc_info=True)
             raise
+        finally:
+            await self.aclose()
@@ -1,10 +1,21 @@
 """Data models for MQTT payloads."""
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Literal, Optional, Union
 from dataclasses import dataclass
+from functools import lru_cache
 from marshmallow import Schema, fields, post_load, validate
 
+try:
+    # orjson is an optional, faster JSON decoder for incoming payloads
+    import orjson as json_module
+except ImportError:
+    import json as json_module
+
 class MqttPayloadSchema(Schema):
     """Schema for MQTT payloads with support for different device types."""
+
+    class Meta:
+        render_module = json_module
+
     state = fields.Str(validate=validate.OneOf(choices=('ON', 'OFF')))
     brightness = fields.Int(validate=validate.Range(min=0, max=255))
     percentage = fields.Int(validate=validate.Range(min=0, max=100))
@@ -34,3 +45,18 @@ class MqttPayloadSchema(Schema):
         return item
 
 mqtt_payload_schema = MqttPayloadSchema()
+
+
+@lru_cache(maxsize=256)
+def _load_mqtt_payload(raw_payload: Union[str, bytes]) -> Dict[str, Any]:
+    return mqtt_payload_schema.loads(raw_payload)
+
+def load_mqtt_payload(raw_payload: Union[str, bytes]) -> Dict[str, Any]:
+    """Validate a JSON command payload, memoizing repeats.
+
+    Home Assistant sends the same few payloads (on, off, a handful of
+    brightness levels) over and over, so a repeat skips JSON decoding and
+    schema validation. Invalid payloads raise ValidationError every time.
+    The caller gets its own copy of the cached dict.
+    """
+    return dict(_load_mqtt_payload(raw_payload))
@@ -1,20 +1,56 @@
 # ./rakomqtt/telnet_interface.py
 import asyncio
 import logging
-from typing import Optional, AsyncGenerator, List
+import socket
+from contextlib import suppress
+from functools import lru_cache
+from typing import Optional, AsyncGenerator, List, Tuple
 
 _LOGGER = logging.getLogger(__name__)
 
+# TCP keepalive: first probe after 30s idle, then every 10s, drop after 3 misses
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+
+# Requests allowed to wait for the writer task; beyond this a send fails
+# straight away instead of piling up behind an unresponsive bridge
+OUTBOX_MAXSIZE = 256
+
+
+# Command lines per the Rako RS232 protocol, built with bytes %-formatting.
+# Scene and level commands recur for the same channels, so they're memoized.
+@lru_cache(maxsize=4096)
+def _scene_command(room: int, channel: int, scene: int) -> bytes:
+    return b"ROOM%02d,CHANNEL%02d,SCENE%02d" % (room, channel, scene)
+
+@lru_cache(maxsize=4096)
+def _level_command(room: int, channel: int, level: int) -> bytes:
+    return b"ROOM%02d,CHANNEL%02d,LEVEL%03d" % (room, channel, level)
+
+@lru_cache(maxsize=256)
+def _room_status_command(room: int) -> bytes:
+    return b"ROOM%02d,STATUS" % room
+
 class RakoTelnetInterface:
     """Telnet interface to Rako bridge (port 9761)."""
     
-    def __init__(self, host: str, port: int = 9761):
+    def __init__(self, host: str, port: int = 9761, read_size: int = 4096,
+                 response_timeout: Optional[float] = 1.0):
         self.host = host
         self.port = port
+        # Upper bound for unframed reads while monitoring
+        self.read_size = read_size
+        # How long to wait for the line answering a command; None waits for
+        # as long as the bridge takes
+        self.response_timeout = response_timeout
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
         self._connected = False
-        self._lock = asyncio.Lock()
+        # Commands are handed to a single writer task instead of contending
+        # for a lock; it owns connect/write/read so replies can't interleave
+        self._outbox: asyncio.Queue[Tuple[List[bytes], asyncio.Future]] = asyncio.Queue(maxsize=OUTBOX_MAXSIZE)
+        self._writer_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> None:
         """Establish telnet connection."""
@@ -22,6 +58,10 @@ class RakoTelnetInterface:
             self.reader, self.writer = await asyncio.open_connection(
                 self.host, self.port
             )
+            # Let a burst of commands queue up in the transport without
+            # drain() having to wait on every one
+            self.writer.transport.set_write_buffer_limits(high=65536, low=16384)
+            self._enable_keepalive(self.writer.get_extra_info('socket'))
             self._connected = True
             _LOGGER.info(f"Connected to Rako bridge telnet interface at {self.host}:{self.port}")
         except Exception as e:
@@ -29,8 +69,26 @@ class RakoTelnetInterface:
             self._connected = False
             raise
 
+    @staticmethod
+    def _enable_keepalive(sock: Optional[socket.socket]) -> None:
+        """Turn on TCP keepalive so a silently dropped bridge is noticed."""
+        if sock is None:
+            return
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # The tuning options are Linux specific; elsewhere the OS defaults apply
+        for option, value in (('TCP_KEEPIDLE', KEEPALIVE_IDLE),
+                              ('TCP_KEEPINTVL', KEEPALIVE_INTERVAL),
+                              ('TCP_KEEPCNT', KEEPALIVE_COUNT)):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+
     async def disconnect(self) -> None:
         """Close telnet connection."""
+        if self._writer_task and self._writer_task is not asyncio.current_task():
+            self._writer_task.cancel()
+            self._writer_task = None
+        # Nothing will answer commands still waiting in the outbox
+        self._fail_pending(ConnectionError("Telnet interface disconnected"))
         if self.writer:
             try:
                 self.writer.close()
@@ -42,37 +100,123 @@ class RakoTelnetInterface:
                 self.writer = None
                 self.reader = None
 
+    def _fail_pending(self, exc: Exception) -> None:
+        """Fail every request still waiting in the outbox."""
+        while not self._outbox.empty():
+            _, future = self._outbox.get_nowait()
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _drop_connection(self) -> None:
+        """Close a connection whose reply stream can no longer be trusted."""
+        self._connected = False
+        writer, self.writer, self.reader = self.writer, None, None
+        if writer:
+            with suppress(Exception):
+                writer.close()
+                await writer.wait_closed()
+
     async def send_command(self, command: bytes) -> Optional[bytes]:
         """Send raw command bytes and return response."""
-        async with self._lock:  # Ensure commands are sent sequentially
-            if not self._connected or not self.writer or not self.reader:
-                await self.connect()
-            
+        responses = await self._submit([command])
+        response = responses[0] if responses else b''
+        _LOGGER.debug("Telnet command response: %s", response)
+        return response
+
+    async def send_commands(self, commands: List[bytes]) -> List[bytes]:
+        """Pipeline several raw commands and return one response per command.
+
+        All commands are written before any reply is read; the bridge
+        answers in order, so the replies line up with the commands.
+        """
+        if not commands:
+            return []
+
+        responses = await self._submit(commands)
+        _LOGGER.debug("Telnet batch responses: %s", responses)
+        return responses
+
+    async def _submit(self, commands: List[bytes]) -> List[bytes]:
+        """Queue commands for the writer task and wait for their replies."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._write_loop())
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._outbox.put_nowait((commands, future))
+        except asyncio.QueueFull:
+            raise ConnectionError(
+                f"Telnet outbox full ({OUTBOX_MAXSIZE} requests waiting), dropping command"
+            ) from None
+        return await future
+
+    async def _write_loop(self) -> None:
+        """Sole consumer of the outbox: write each request, read its replies."""
+        while True:
+            commands, future = await self._outbox.get()
+            if future.done():
+                # The caller gave up (e.g. timed out) before we got to it
+                continue
             try:
-                self.writer.write(command + b'\r\n')
+                if not self._connected or not self.writer or not self.reader:
+                    await self.connect()
+
+                self.writer.writelines(
+                    frame for command in commands for frame in (command, b'\r\n')
+                )
                 await self.writer.drain()
-                
-                # Read response
-                response = await self.reader.read(256)
-                _LOGGER.debug(f"Telnet command response: {response}")
-                return response
+
+                # Each command is answered with one line; collect them all
+                responses = []
+                for _ in commands:
+                    line = await self._read_response()
+                    if not line:
+                        break
+                    responses.append(line)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.set_exception(ConnectionError("Telnet interface disconnected"))
+                raise
             except Exception as e:
                 _LOGGER.error(f"Error sending telnet command: {e}")
-                self._connected = False
-                raise
+                # A late reply would be read as the answer to the next command,
+                # so start over on a fresh connection; queued requests were
+                # waiting on this one and fail with it
+                await self._drop_connection()
+                if not future.done():
+                    future.set_exception(e)
+                self._fail_pending(ConnectionError(f"Telnet connection lost: {e}"))
+            else:
+                if not future.done():
+                    future.set_result(responses)
+
+    async def _read_response(self) -> bytes:
+        """Read the single line the bridge sends back for a command."""
+        try:
+            return await asyncio.wait_for(
+                self.reader.readuntil(b'\n'),
+                timeout=self.response_timeout
+            )
+        except asyncio.IncompleteReadError as e:
+            # Connection closed mid-line; hand back whatever arrived
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            # No newline within the reader's limit; take the buffered chunk
+            # as the reply, as the unframed read used to
+            return await self.reader.readexactly(e.consumed)
 
     async def send_scene_command(self, room: int, channel: int, scene: int) -> None:
         """Send scene command over telnet."""
         # Format according to Rako RS232 protocol: ROOMxx,CHANNELxx,SCENExx
-        command = f"ROOM{room:02d},CHANNEL{channel:02d},SCENE{scene:02d}".encode()
+        commands = [_scene_command(room, channel, scene)]
+        # If this is a channel 0 command, get status for all channels in the
+        # room; both commands go out in one write
+        if channel == 0:
+            commands.append(_room_status_command(room))
         try:
-            response = await self.send_command(command)
-            if response and b'OK' not in response:
-                _LOGGER.warning(f"Unexpected response for scene command: {response}")
-
-            # If this was a channel 0 command, get status for all channels in room
-            if channel == 0:
-                await self.get_room_status(room)
+            responses = await self.send_commands(commands)
+            for kind, response in zip(("scene command", "room status"), responses):
+                if response and b'OK' not in response:
+                    _LOGGER.warning("Unexpected response for %s: %s", kind, response)
 
         except Exception as e:
             _LOGGER.error(f"Failed to send scene command: {e}")
@@ -81,7 +225,7 @@ class RakoTelnetInterface:
     async def get_room_status(self, room: int) -> None:
         """Get status for all channels in a room."""
         try:
-            command = f"ROOM{room:02d},STATUS".encode()
+            command = _room_status_command(room)
             response = await self.send_command(command)
             if response and b'OK' not in response:
                 _LOGGER.warning(f"Unexpected response for room status: {response}")
@@ -92,7 +236,7 @@ class RakoTelnetInterface:
     async def send_level_command(self, room: int, channel: int, level: int) -> None:
         """Send level command over telnet."""
         # Format: ROOMxx,CHANNELxx,LEVELxxx
-        command = f"ROOM{room:02d},CHANNEL{channel:02d},LEVEL{level:03d}".encode()
+        command = _level_command(room, channel, level)
         try:
             response = await self.send_command(command)
             if response and b'OK' not in response:
@@ -103,7 +247,7 @@ class RakoTelnetInterface:
 
     async def send_identify_command(self, room: int, channel: int) -> None:
         """Send identify command over telnet."""
-        command = f"ROOM{room:02d},CHANNEL{channel:02d},IDENT".encode()
+        command = b"ROOM%02d,CHANNEL%02d,IDENT" % (room, channel)
         try:
             response = await self.send_command(command)
             if response and b'OK' not in response:
@@ -117,14 +261,17 @@ class RakoTelnetInterface:
         if not self._connected:
             await self.connect()
             
+        # Reads come out of the StreamReader's own buffer, which already
+        # coalesces socket reads; the chunks are yielded as bytes because
+        # consumers may hold on to them past the next read
         while self._connected and self.reader:
             try:
-                response = await self.reader.read(256)
+                response = await self.reader.read(self.read_size)
                 if not response:  # Connection closed
                     self._connected = False
                     break
                     
-                _LOGGER.debug(f"Received telnet response: {response}")
+                _LOGGER.debug("Received telnet response: %s", response)
                 yield response
             except Exception as e:
                 _LOGGER.error(f"Error monitoring telnet responses: {e}")
@@ -135,8 +282,12 @@ class RakoTelnetInterface:
     def _parse_response(response: bytes) -> List[str]:
         """Parse telnet response into components."""
         try:
-            decoded = response.decode().strip()
-            return [part.strip() for part in decoded.split(',')]
+            # The protocol is plain ASCII, so split the bytes and only
+            # decode the individual tokens
+            return [
+                part.strip().decode('ascii', 'replace')
+                for part in response.strip().split(b',')
+            ]
         except Exception as e:
             _LOGGER.error(f"Error parsing telnet response: {e}")
             return []
@@ -0,0 +1,98 @@
+# flake8: noqa
+import asyncio
+import unittest
+from unittest import mock
+
+from rakomqtt import bridge
+from rakomqtt.bridge import RakoMQTTBridge
+from rakomqtt.RakoBridge import SceneCacheEntry
+
+
+class TestSceneCacheMonitor(unittest.IsolatedAsyncioTestCase):
+    """
+    Testing scene cache refreshes triggered by status traffic
+    """
+
+    async def asyncSetUp(self):
+        self.bridge = RakoMQTTBridge("rako.local", "mqtt.local", "user", "password")
+        self.bridge.mqtt_client.publish = mock.AsyncMock()
+
+    async def test_dirty_event_publishes_changed_scene_once(self):
+        fetched = asyncio.Queue()
+        caches = [
+            [SceneCacheEntry(4, 1)],
+            [SceneCacheEntry(4, 1), SceneCacheEntry(6, 4)],
+        ]
+
+        async def get_scene_cache():
+            await fetched.put(None)
+            return caches.pop(0) if caches else await asyncio.Future()
+
+        self.bridge.rako_bridge.get_scene_cache = get_scene_cache
+        with mock.patch.object(bridge, "SCENE_CACHE_SETTLE_DELAY", 0):
+            task = asyncio.create_task(self.bridge.monitor_scene_cache())
+            try:
+                await asyncio.wait_for(fetched.get(), timeout=1)
+                self.bridge._scene_cache_dirty.set()
+                await asyncio.wait_for(fetched.get(), timeout=1)
+                # An unchanged cache is not refetched without new traffic
+                await asyncio.sleep(0)
+                self.assertTrue(fetched.empty())
+                self.bridge._scene_cache_dirty.set()
+                await asyncio.wait_for(fetched.get(), timeout=1)
+            finally:
+                task.cancel()
+
+        self.assertEqual(self.bridge.mqtt_client.publish.await_args_list, [
+            mock.call("rako/room/4/state", bridge._scene_cache_payload(1), qos=1, retain=True),
+            mock.call("rako/room/6/state", bridge._scene_cache_payload(4), qos=1, retain=True),
+        ])
+
+
+class TestStatusDedupe(unittest.IsolatedAsyncioTestCase):
+    """
+    Testing repeated status updates for the same topic
+    """
+
+    topic = "rako/room/5/channel/1/state"
+
+    async def asyncSetUp(self):
+        self.bridge = RakoMQTTBridge("rako.local", "mqtt.local", "user", "password")
+        self.bridge.mqtt_client.publish = mock.AsyncMock()
+
+    async def publish(self, payload):
+        self.bridge.queue_status(self.topic, payload)
+        task = asyncio.create_task(self.bridge.publish_status_updates())
+        try:
+            await asyncio.sleep(bridge.STATUS_COALESCE_INTERVAL * 2)
+        finally:
+            task.cancel()
+
+    def published_topics(self):
+        return [c.args[0] for c in self.bridge.mqtt_client.publish.await_args_list]
+
+    async def test_repeat_within_window_is_dropped(self):
+        await self.publish({"state": "ON", "brightness": 42})
+        await self.publish({"state": "ON", "brightness": 42})
+        self.assertEqual(self.published_topics(), [self.topic, "rako/room/5/channel/0/state"])
+
+    async def test_repeat_after_window_is_published(self):
+        await self.publish({"state": "ON", "brightness": 42})
+        with mock.patch.object(bridge, "STATUS_DEDUPE_WINDOW", 0):
+            await self.publish({"state": "ON", "brightness": 42})
+        self.assertEqual(self.published_topics().count(self.topic), 2)
+
+    async def test_repeated_button_press_is_published(self):
+        press = {"state": "ON", "brightness": 0, "scene": 1, "event": "button_press"}
+        await self.publish(press)
+        await self.publish(press)
+        self.assertEqual(self.published_topics().count(self.topic), 2)
+
+    async def test_reconnect_forgets_published_state(self):
+        await self.publish({"state": "ON", "brightness": 42})
+        client = self.bridge.mqtt_client
+        client._loop = asyncio.get_running_loop()
+        client._on_connect(mock.Mock(), None, {}, 0)
+        await asyncio.sleep(0)
+        await self.publish({"state": "ON", "brightness": 42})
+        self.assertEqual(self.published_topics().count(self.topic), 2)
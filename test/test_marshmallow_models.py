@@ -1,7 +1,7 @@
 import json
 import unittest
 
-from rakomqtt.model import mqtt_payload_schema
+from rakomqtt.model import load_mqtt_payload, mqtt_payload_schema
 
 
 class TestMarshmallowModels(unittest.TestCase):
@@ -19,4 +19,9 @@ class TestMarshmallowModels(unittest.TestCase):
                 payload_result = mqtt_payload_schema.loads(in_str)
                 self.assertEqual(payload_result, exp_dict)
 
-
+    def test_load_mqtt_payload_returns_copies(self):
+        in_str = json.dumps({"state": "ON", "brightness": 40})
+        first = load_mqtt_payload(in_str)
+        first["brightness"] = 0
+        self.assertEqual(load_mqtt_payload(in_str), {"state": "ON", "brightness": 40})
+        self.assertEqual(load_mqtt_payload(in_str.encode()), {"state": "ON", "brightness": 40})
@@ -2,7 +2,9 @@
 import json
 import unittest
 
-from rakomqtt.RakoBridge import RakoStatusMessage, RakoCommandType, RakoBridge, RakoCommand
+from rakomqtt.RakoBridge import (
+    RakoStatusMessage, RakoCommandType, RakoBridge, RakoCommand, RakoFadeRate, LevelCacheEntry, SceneCacheEntry
+)
 
 
 class TestRakoWatching(unittest.TestCase):
@@ -21,6 +23,7 @@ class TestRakoWatching(unittest.TestCase):
         ("diff scene legacy", [83, 5, 0, 13, 0, 4, 239], RakoStatusMessage(13, 0, RakoCommandType.SET_SCENE, 2, 192)),
         ("diff room legacy", [83, 5, 0, 21, 0, 6, 229], RakoStatusMessage(21, 0, RakoCommandType.SET_SCENE, 4, 64)),
         ("room off", [83, 5, 0, 21, 0, 0, 235], RakoStatusMessage(21, 0, RakoCommandType.SET_SCENE, 0, 0)),
+        ("base level raw datagram", bytes([83, 7, 0, 5, 1, 52, 1, 255, 198]), RakoStatusMessage(5, 1, RakoCommandType.SET_LEVEL, None, 255)),
     ]
 
     def test_deserialise_status_msg(self):
@@ -62,6 +65,16 @@ class TestRakoCommanding(unittest.TestCase):
         ("scene base", 'rako/room/5/set', json.dumps({"state": "ON", "brightness": 90}), RakoCommand(5, 0, 4, None)),
         ("diff scene", 'rako/room/5/set', json.dumps({"state": "ON", "brightness": 100}), RakoCommand(5, 0, 3, None)),
         ("diff room", 'rako/room/9/set', json.dumps({"state": "ON", "brightness": 100}), RakoCommand(9, 0, 3, None)),
+        ("cover open", 'rako/room/5/channel/2/command', 'OPEN', RakoCommand(5, 2, command=RakoCommandType.FADE_UP)),
+        ("cover stop quoted", 'rako/room/5/channel/2/command', '"stop"', RakoCommand(5, 2, command=RakoCommandType.STOP)),
+        ("transition medium", 'rako/room/5/channel/1/set', json.dumps({"brightness": 40, "transition": 3}), RakoCommand(5, 1, brightness=40, fade_rate=RakoFadeRate.MEDIUM)),
+        ("transition extra slow", 'rako/room/5/channel/1/set', json.dumps({"brightness": 40, "transition": 17}), RakoCommand(5, 1, brightness=40, fade_rate=RakoFadeRate.EXTRA_SLOW)),
+        ("raw bytes payload", 'rako/room/13/channel/1/set', b'{"state": "ON", "brightness": 25}', RakoCommand(13, 1, None, 25)),
+        ("cover close bytes", 'rako/room/5/channel/2/command', b'CLOSE', RakoCommand(5, 2, command=RakoCommandType.FADE_DOWN)),
+        ("cover close padded", 'rako/room/5/channel/2/command', ' close ', None),
+        ("cover close bytes padded", 'rako/room/5/channel/2/command', b'CLOSE\n', None),
+        ("unknown topic", 'rako/room/5/channel/2/get', json.dumps({"state": "ON"}), None),
+        ("non numeric room", 'rako/room/five/channel/2/set', json.dumps({"state": "ON"}), None),
     ]
 
     def test_deserialise_topic_payload(self):
@@ -69,3 +82,41 @@ class TestRakoCommanding(unittest.TestCase):
             with self.subTest(name):
                 cmd_result = RakoCommand.from_mqtt(in_topic, in_payload)
                 self.assertEqual(cmd_result, expected)
+
+    to_udp_command_cases = [
+        # name, in_cmd, expected bytes
+        ("level", RakoCommand(5, 1, brightness=128), bytes([82, 7, 0, 5, 1, 52, 2, 128, 61])),
+        ("scene fast", RakoCommand(5, 0, scene=2, fade_rate=RakoFadeRate.FAST), bytes([82, 7, 0, 5, 0, 49, 1, 2, 192])),
+        ("extended room stop", RakoCommand(300, 2, command=RakoCommandType.STOP), bytes([82, 6, 1, 44, 2, 15, 0, 188])),
+    ]
+
+    def test_to_udp_command(self):
+        for name, in_cmd, expected in self.to_udp_command_cases:
+            with self.subTest(name):
+                self.assertEqual(in_cmd.to_udp_command(), expected)
+
+
+class TestRakoCaches(unittest.TestCase):
+    """
+    Testing the level and scene caches read from the Rako Bridge
+    """
+
+    def setUp(self):
+        self.bridge = RakoBridge(host='127.0.0.1')
+
+    def test_parse_level_cache(self):
+        levels = list(range(0, 256, 16))
+        record = bytes([0x58, 0x04, 0x81, 0x2C, 2, *levels])
+        # leading noise and a non level-cache record must be skipped
+        content = '00 58 01 ' + record.hex() + ' ' + bytes([0x58, 0x04, 0x40, 5, 1, *([0] * 16)]).hex()
+        entries = self.bridge._parse_level_cache(content)
+        self.assertEqual(entries, [
+            LevelCacheEntry(room_id=300, channel_id=2, levels=bytes(levels), active=True, deleted=False),
+            LevelCacheEntry(room_id=5, channel_id=1, levels=bytes(16), active=False, deleted=True),
+        ])
+        # the raw response body is bytes and may be split across lines
+        self.assertEqual(self.bridge._parse_level_cache(content.replace(' ', '\r\n').encode()), entries)
+
+    def test_parse_scene_cache(self):
+        entries = self.bridge._parse_scene_cache('0x1004400c')
+        self.assertEqual(entries, [SceneCacheEntry(room_id=4, scene_id=1), SceneCacheEntry(room_id=12, scene_id=4)])
@@ -0,0 +1,127 @@
+# flake8: noqa
+import asyncio
+import unittest
+from unittest import mock
+
+from rakomqtt.telnet_interface import RakoTelnetInterface
+
+
+class TestTelnetErrorRecovery(unittest.IsolatedAsyncioTestCase):
+    """
+    Testing the telnet writer task after a command goes unanswered
+    """
+
+    async def asyncSetUp(self):
+        self.connections = 0
+        self.first_closed = asyncio.Event()
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.telnet = RakoTelnetInterface("127.0.0.1", port, response_timeout=0.05)
+
+    async def asyncTearDown(self):
+        await self.telnet.disconnect()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        if self.connections == 1:
+            # Answer too late; the reply must not reach the next command
+            await reader.readuntil(b"\r\n")
+            await asyncio.sleep(0.1)
+            writer.write(b"STALE\r\n")
+            await reader.read()
+            self.first_closed.set()
+        else:
+            while line := await reader.readline():
+                writer.write(b"OK " + line)
+                await writer.drain()
+        writer.close()
+
+    async def test_read_timeout_drops_connection(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.telnet.send_command(b"ROOM01,STATUS")
+
+        self.assertIsNone(self.telnet.writer)
+        self.assertIsNone(self.telnet.reader)
+        await asyncio.wait_for(self.first_closed.wait(), timeout=1)
+
+        response = await self.telnet.send_command(b"ROOM02,STATUS")
+        self.assertEqual(response, b"OK ROOM02,STATUS\r\n")
+        self.assertEqual(self.connections, 2)
+
+    async def test_read_timeout_fails_queued_requests(self):
+        first = asyncio.ensure_future(self.telnet.send_command(b"ROOM01,STATUS"))
+        queued = asyncio.ensure_future(self.telnet.send_command(b"ROOM02,STATUS"))
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await first
+        with self.assertRaises(ConnectionError):
+            await queued
+
+
+class TestTelnetPipelining(unittest.IsolatedAsyncioTestCase):
+    """
+    Testing commands sent together in one write
+    """
+
+    async def asyncSetUp(self):
+        self.received = []
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.telnet = RakoTelnetInterface("127.0.0.1", port)
+
+    async def asyncTearDown(self):
+        await self.telnet.disconnect()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        while line := await reader.readline():
+            self.received.append(line)
+            writer.write(b"OK " + line)
+            await writer.drain()
+        writer.close()
+
+    async def test_send_commands_replies_in_order(self):
+        responses = await self.telnet.send_commands([b"ROOM01,STATUS", b"ROOM02,STATUS"])
+        self.assertEqual(responses, [b"OK ROOM01,STATUS\r\n", b"OK ROOM02,STATUS\r\n"])
+
+    async def test_channel0_scene_requests_room_status(self):
+        with mock.patch.object(self.telnet, "send_commands", wraps=self.telnet.send_commands) as send_commands:
+            await self.telnet.send_scene_command(5, 0, 3)
+
+        send_commands.assert_awaited_once_with([b"ROOM05,CHANNEL00,SCENE03", b"ROOM05,STATUS"])
+        self.assertEqual(self.received, [b"ROOM05,CHANNEL00,SCENE03\r\n", b"ROOM05,STATUS\r\n"])
+
+    async def test_channel_scene_sends_scene_only(self):
+        await self.telnet.send_scene_command(5, 2, 3)
+        self.assertEqual(self.received, [b"ROOM05,CHANNEL02,SCENE03\r\n"])
+
+
+class TestTelnetReadResponse(unittest.IsolatedAsyncioTestCase):
+    """
+    Testing replies that never end in a newline
+    """
+
+    def make_telnet(self, data, limit=2 ** 16, eof=True):
+        telnet = RakoTelnetInterface("127.0.0.1", response_timeout=None)
+        telnet.reader = asyncio.StreamReader(limit=limit)
+        telnet.reader.feed_data(data)
+        if eof:
+            telnet.reader.feed_eof()
+        return telnet
+
+    async def test_line_reply(self):
+        telnet = self.make_telnet(b"OK\r\nOK\r\n", eof=False)
+        self.assertEqual(await telnet._read_response(), b"OK\r\n")
+        self.assertEqual(await telnet._read_response(), b"OK\r\n")
+
+    async def test_unterminated_reply_before_eof(self):
+        telnet = self.make_telnet(b"OK")
+        self.assertEqual(await telnet._read_response(), b"OK")
+        self.assertEqual(await telnet._read_response(), b"")
+
+    async def test_unterminated_reply_over_limit(self):
+        telnet = self.make_telnet(b"ROOM01,CHANNEL02,LEVEL255", limit=8, eof=False)
+        self.assertEqual(await telnet._read_response(), b"ROOM01,CHANNEL02,LEVEL255")